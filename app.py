@@ -13,46 +13,69 @@ This app helps conduct structured research through:
 """
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 import json
 import os
+import shutil
+import hashlib
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Optional
 import uuid
-from openai import OpenAI
+import secrets
+import itertools
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from prompt_templates import SUMMARY_REFERENCE, fill_template, split_template
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json module
+    orjson = None
 
 # ============================================================
 # DATA MODELS
 # ============================================================
 
-@dataclass
+# Ids only need to be unique, so a random prefix plus a counter replaces an
+# os.urandom read per object. Streamlit re-executes this module on each
+# rerun, which just picks a fresh prefix.
+_id_prefix = secrets.token_hex(8)
+_id_counter = itertools.count()
+
+def new_id() -> str:
+    """Generate a unique id for a new object."""
+    return f"{_id_prefix}{next(_id_counter):08x}"
+
+@dataclass(slots=True)
 class Message:
     role: str
     content: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     title: str
     description: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
 
-@dataclass
+@dataclass(slots=True)
 class ResearchFinding:
     topic: str
     description: str
     citation: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
 
-@dataclass
+@dataclass(slots=True)
 class MeetingMessage:
     participant_name: str
     content: str
     participant_id: Optional[str] = None
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
 
-@dataclass
+@dataclass(slots=True)
 class Meeting:
     topic: str
     description: str
@@ -60,14 +83,14 @@ class Meeting:
     is_complete: bool = False
     turn_count: int = 0
     summary_report: Optional[str] = None
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     name: str
     created_date: str = field(default_factory=lambda: datetime.now().isoformat())
     last_modified_date: str = field(default_factory=lambda: datetime.now().isoformat())
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
 
 # ============================================================
 # PROMPTS CONFIGURATION
@@ -102,6 +125,17 @@ Return your response as a JSON array with exactly 10 objects, each having "topic
 
     "research-system-prompt": """You will be working on researching information for a task. You are a consultant who uses web search to find current, accurate information from reliable sources. The user will provide an executive summary of the task at hand. Output each search result with a clear topic name, detailed description with specific facts, and proper source citation.""",
 
+    "people-research-combined": """You are working as a consultant for Abu Dhabi government. You have been provided with an executive summary of a task that the user is working to accomplish:
+
+{EXECUTIVE_SUMMARY}
+
+First, assemble a team of five people from interdisciplinary backgrounds to tackle this task. They should bring unique perspectives from leading former projects in this space to understanding human behavior to create strong incentives to attract people. Make it diverse in the skillset. Be creative.
+
+Second, research and find ten previous examples of similar work done by other nations, companies, organizations, or institutions that are relevant to accomplishing the task.
+
+Return your response as a single JSON object with a "people" array of exactly 5 objects, each having "title" and "description" fields, and a "research" array of exactly 10 objects, each having "topic", "description", and "citation" fields. Example format:
+{"people": [{"title": "Title Here", "description": "Description here"}, ...], "research": [{"topic": "Topic Name", "description": "Detailed description", "citation": "Source URL or publication"}, ...]}""",
+
     "meeting-sub-report-prompt": """You are creating a summary report for a meeting. The meeting was about:
 
 Topic: {MEETING_TOPIC}
@@ -140,50 +174,119 @@ And here are the summaries from the meetings:
 # FILE PATHS AND STORAGE
 # ============================================================
 
+@st.cache_resource
 def get_data_dir() -> Path:
     """Get the data directory for storing sessions and config."""
     data_dir = Path.home() / ".virtual_lab"
     data_dir.mkdir(exist_ok=True)
     return data_dir
 
+@st.cache_resource
 def get_sessions_dir() -> Path:
     """Get the sessions directory."""
     sessions_dir = get_data_dir() / "sessions"
     sessions_dir.mkdir(exist_ok=True)
     return sessions_dir
 
+@st.cache_resource
 def get_config_path() -> Path:
     """Get the config file path."""
     return get_data_dir() / "config.json"
 
+@st.cache_resource
 def get_prompts_path() -> Path:
     """Get the prompts file path."""
     return get_data_dir() / "prompts.json"
 
+@st.cache_resource
+def get_response_cache_dir() -> Path:
+    """Get the directory of stored API responses."""
+    cache_dir = get_data_dir() / "response_cache"
+    cache_dir.mkdir(exist_ok=True)
+    return cache_dir
+
+def _dumps(obj) -> bytes:
+    """Serialize an object to compact JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _dumps_indented(obj) -> bytes:
+    """Serialize an object to JSON bytes indented by two spaces."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+def _loads(data: bytes):
+    """Parse JSON bytes or text."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _atomic_write(path: Path, data: bytes):
+    """Write a file via a temporary file and a rename, so readers never see it half-written."""
+    # Unique per writer, so concurrent sessions saving the same file never share a temp file
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+@st.cache_resource
+def _written_digests() -> dict:
+    """Digest and mtime of the bytes last written to each path, kept across reruns."""
+    return {}
+
+def _write_bytes(path: Path, payload: bytes):
+    """Write bytes to a file unless it already holds exactly these bytes.
+
+    Streamlit reruns often save state that has not changed; comparing a
+    digest of what we last wrote (and checking the file was not touched
+    since) turns those saves into a stat call.
+    """
+    digest = hashlib.sha256(payload).digest()
+    written = _written_digests()
+    if path.exists() and written.get(path) == (digest, path.stat().st_mtime_ns):
+        return
+    _atomic_write(path, payload)
+    written[path] = (digest, path.stat().st_mtime_ns)
+
+def _dump(obj, path: Path, indent: bool = False):
+    """Write an object to a JSON file, pretty-printed only for files people edit by hand."""
+    _write_bytes(path, _dumps_indented(obj) if indent else _dumps(obj))
+
+def _load(path: Path):
+    """Read and parse a JSON file."""
+    return _loads(path.read_bytes())
+
 # ============================================================
 # CONFIGURATION MANAGEMENT
 # ============================================================
 
+@st.cache_data(ttl=None)
 def load_config() -> dict:
     """Load configuration including API key."""
     config_path = get_config_path()
     if config_path.exists():
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return _load(config_path)
     return {"api_key": ""}
 
 def save_config(config: dict):
     """Save configuration."""
-    with open(get_config_path(), 'w') as f:
-        json.dump(config, f, indent=2)
+    _dump(config, get_config_path(), indent=True)
+    load_config.clear()
+
+# Shared across reruns and sessions without copying; callers must not modify the result
+@st.cache_resource(max_entries=1)
+def _load_prompts(mtime_ns: int) -> dict:
+    """Parse the prompts file as of the given modification time."""
+    data = _load(get_prompts_path())
+    return {p['id']: p['content'] for p in data.get('prompts', [])}
 
 def load_prompts() -> dict:
     """Load prompts from file or return defaults."""
     prompts_path = get_prompts_path()
     if prompts_path.exists():
-        with open(prompts_path, 'r') as f:
-            data = json.load(f)
-            return {p['id']: p['content'] for p in data.get('prompts', [])}
+        # Keyed on mtime so edits made outside this app are still picked up
+        return _load_prompts(prompts_path.stat().st_mtime_ns)
     # Save defaults if file doesn't exist
     save_prompts(DEFAULT_PROMPTS)
     return DEFAULT_PROMPTS
@@ -194,36 +297,57 @@ def save_prompts(prompts: dict):
         "prompts": [{"id": k, "content": v, "name": k.replace("-", " ").title()} for k, v in prompts.items()],
         "version": "1.0"
     }
-    with open(get_prompts_path(), 'w') as f:
-        json.dump(data, f, indent=2)
+    _dump(data, get_prompts_path(), indent=True)
+    _load_prompts.clear()
 
 def get_prompt(prompt_id: str) -> str:
     """Get a prompt by ID."""
-    prompts = load_prompts()
-    return prompts.get(prompt_id, DEFAULT_PROMPTS.get(prompt_id, ""))
+    return load_prompts().get(prompt_id, DEFAULT_PROMPTS.get(prompt_id, ""))
+
+@st.cache_resource(max_entries=64)
+def compile_template(template: str) -> tuple:
+    """Split a prompt template into alternating literal and placeholder segments."""
+    return split_template(template)
+
+def render_prompt(prompt_id: str, **values: str) -> str:
+    """Fill a prompt's {PLACEHOLDERS} in a single pass.
+
+    Placeholders without a value are left as written.
+    """
+    return fill_template(compile_template(get_prompt(prompt_id)), values)
 
 # ============================================================
 # SESSION MANAGEMENT
 # ============================================================
 
+@st.cache_data(ttl=None)
+def _load_sessions_metadata(mtime_ns: int) -> list:
+    """Parse the sessions metadata file as of the given modification time."""
+    return _load(get_sessions_dir() / "metadata.json")
+
 def load_sessions_metadata() -> list:
     """Load list of all sessions."""
     metadata_path = get_sessions_dir() / "metadata.json"
     if metadata_path.exists():
-        with open(metadata_path, 'r') as f:
-            return json.load(f)
+        # Keyed on mtime so edits made outside this app are still picked up
+        return _load_sessions_metadata(metadata_path.stat().st_mtime_ns)
     return []
 
 def save_sessions_metadata(sessions: list):
     """Save sessions metadata."""
-    with open(get_sessions_dir() / "metadata.json", 'w') as f:
-        json.dump(sessions, f, indent=2)
+    _dump(sessions, get_sessions_dir() / "metadata.json")
+    _load_sessions_metadata.clear()
 
 def create_session(name: str) -> Session:
     """Create a new session."""
     session = Session(name=name)
     sessions = load_sessions_metadata()
-    sessions.append(asdict(session))
+    sessions.append({
+        "id": session.id,
+        "name": session.name,
+        "created_date": session.created_date,
+        "last_modified_date": session.last_modified_date
+    })
     save_sessions_metadata(sessions)
     return session
 
@@ -232,18 +356,30 @@ def delete_session(session_id: str):
     sessions = load_sessions_metadata()
     sessions = [s for s in sessions if s['id'] != session_id]
     save_sessions_metadata(sessions)
-    # Delete session data file
-    session_file = get_sessions_dir() / f"{session_id}.json"
-    if session_file.exists():
-        session_file.unlink()
+    # Delete session data
+    session_dir = get_sessions_dir() / session_id
+    if session_dir.exists():
+        shutil.rmtree(session_dir)
+
+def get_session_dir(session_id: str) -> Path:
+    """Get the directory holding a session's data files."""
+    session_dir = get_sessions_dir() / session_id
+    session_dir.mkdir(exist_ok=True)
+    return session_dir
+
+def strip_topic_messages(meetings: list):
+    """Drop the "Meeting Topic:" pseudo-message older meetings stored first.
+
+    The topic and description live in their own meeting fields.
+    """
+    for meeting in meetings:
+        messages = meeting['messages']
+        if messages and not messages[0].get('participant_id') and messages[0].get('participant_name', '').startswith("Meeting Topic:"):
+            del messages[0]
 
 def load_session_data(session_id: str) -> dict:
     """Load data for a specific session."""
-    session_file = get_sessions_dir() / f"{session_id}.json"
-    if session_file.exists():
-        with open(session_file, 'r') as f:
-            return json.load(f)
-    return {
+    data = {
         "messages": [],
         "summary": "",
         "people": [],
@@ -253,41 +389,315 @@ def load_session_data(session_id: str) -> dict:
         "report_chat_messages": []
     }
 
-def save_session_data(session_id: str, data: dict):
-    """Save data for a specific session."""
-    with open(get_sessions_dir() / f"{session_id}.json", 'w') as f:
-        json.dump(data, f, indent=2)
+    session_dir = get_sessions_dir() / session_id
+    legacy_file = get_sessions_dir() / f"{session_id}.json"
+    if not session_dir.exists():
+        # Migrate sessions saved as a single JSON file. The file is left in
+        # place as the original copy; the Flask backend keeps its own store.
+        if legacy_file.exists():
+            data.update(_load(legacy_file))
+            strip_topic_messages(data["meetings"])
+            save_session_data(session_id, data)
+        return data
+
+    messages_path = session_dir / "messages.jsonl"
+    if messages_path.exists():
+        data["messages"] = [_loads(line) for line in messages_path.read_bytes().splitlines() if line.strip()]
+    summary_path = session_dir / "summary.md"
+    if summary_path.exists():
+        data["summary"] = summary_path.read_text(encoding="utf-8")
+    people_path = session_dir / "people.json"
+    if people_path.exists():
+        data["people"] = _load(people_path)
+    research_path = session_dir / "research.json"
+    if research_path.exists():
+        data["research_findings"] = _load(research_path)
+    meetings_index_path = session_dir / "meetings" / "index.json"
+    if meetings_index_path.exists():
+        data["meetings"] = [
+            _load(session_dir / "meetings" / f"{meeting_id}.json")
+            for meeting_id in _load(meetings_index_path)
+        ]
+    strip_topic_messages(data["meetings"])
+    report_path = session_dir / "report.md"
+    if report_path.exists():
+        data["final_report"] = report_path.read_text(encoding="utf-8")
+    report_chat_path = session_dir / "report_chat.json"
+    if report_chat_path.exists():
+        data["report_chat_messages"] = _load(report_chat_path)
+    return data
+
+def append_message(session_id: str, message: dict):
+    """Append one discovery chat message to a session."""
+    with open(get_session_dir(session_id) / "messages.jsonl", 'ab') as f:
+        f.write(_dumps(message) + b"\n")
+
+def save_messages(session_id: str, messages: list):
+    """Rewrite all discovery chat messages of a session."""
+    payload = b"".join(_dumps(message) + b"\n" for message in messages)
+    _write_bytes(get_session_dir(session_id) / "messages.jsonl", payload)
+
+def save_summary(session_id: str, summary: str):
+    """Save the executive summary of a session."""
+    _write_bytes(get_session_dir(session_id) / "summary.md", summary.encode("utf-8"))
+
+def save_people(session_id: str, people: list):
+    """Save the team members of a session."""
+    _dump(people, get_session_dir(session_id) / "people.json")
+
+def save_research(session_id: str, research_findings: list):
+    """Save the research findings of a session."""
+    _dump(research_findings, get_session_dir(session_id) / "research.json")
+
+def save_meeting(session_id: str, meeting: dict):
+    """Save one meeting of a session."""
+    meetings_dir = get_session_dir(session_id) / "meetings"
+    meetings_dir.mkdir(exist_ok=True)
+    _dump(meeting, meetings_dir / f"{meeting['id']}.json")
+
+def save_meetings(session_id: str, meetings: list):
+    """Save the meetings of a session, one file each plus their order."""
+    meetings_dir = get_session_dir(session_id) / "meetings"
+    meetings_dir.mkdir(exist_ok=True)
+    for meeting in meetings:
+        save_meeting(session_id, meeting)
+
+    meeting_ids = [meeting['id'] for meeting in meetings]
+    _dump(meeting_ids, meetings_dir / "index.json")
+    for path in meetings_dir.glob("*.json"):
+        if path.stem != "index" and path.stem not in meeting_ids:
+            path.unlink()
+
+def save_report(session_id: str, final_report: str):
+    """Save the final report of a session."""
+    _write_bytes(get_session_dir(session_id) / "report.md", final_report.encode("utf-8"))
+
+def save_report_chat(session_id: str, report_chat_messages: list):
+    """Save the report chat of a session."""
+    _dump(report_chat_messages, get_session_dir(session_id) / "report_chat.json")
+
+# Writer for each session field; only the fields passed to save_session_data are written
+SESSION_WRITERS = {
+    "messages": save_messages,
+    "summary": save_summary,
+    "people": save_people,
+    "research_findings": save_research,
+    "meetings": save_meetings,
+    "final_report": save_report,
+    "report_chat_messages": save_report_chat,
+}
+
+def save_session_data(session_id: str, data: dict, keys=None):
+    """Save data for a specific session, limited to ``keys`` if given."""
+    keys = data.keys() if keys is None else keys
+    for key in keys:
+        SESSION_WRITERS[key](session_id, data[key])
 
 # ============================================================
 # OPENAI API SERVICE
 # ============================================================
 
+_openai_module = None
+
+def _openai():
+    """Import the OpenAI SDK on first use so pages that never call the API skip it."""
+    global _openai_module
+    if _openai_module is None:
+        import openai
+        _openai_module = openai
+    return _openai_module
+
+NO_API_KEY_ERROR = "Error: API key not configured. Please set your API key in Settings."
+
+def build_chat_request(model: str, messages: list, system_prompt: str = None, cache_key: str = None) -> dict:
+    """Build the keyword arguments for a chat completion request.
+
+    ``messages`` must already be plain role/content dicts (see
+    ``get_discovery_api_messages`` for the stored chat). OpenAI caches repeated
+    prompt prefixes automatically; passing the same ``cache_key`` for calls
+    that share a prefix routes them to the same cache.
+    """
+    if system_prompt:
+        api_messages = [{"role": "system", "content": system_prompt}, *messages]
+    else:
+        api_messages = list(messages)
+
+    request = {"model": model, "max_tokens": 4096, "messages": api_messages}
+    if cache_key:
+        request["extra_body"] = {"prompt_cache_key": cache_key}
+    return request
+
+@st.cache_resource
+def _get_openai_client(api_key: str):
+    """Get a shared OpenAI client so its connection pool survives reruns.
+
+    HTTP/2 with long-lived keep-alive connections saves a TLS handshake on
+    each of the many back-to-back calls a meeting makes, and extra retries
+    absorb transient 429s.
+    """
+    if not api_key:
+        return None
+
+    import httpx
+    http_client = httpx.Client(
+        http2=True,
+        timeout=120.0,
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300.0)
+    )
+    return _openai().OpenAI(api_key=api_key, http_client=http_client, max_retries=5)
+
+def _new_async_openai_client(api_key: str):
+    """Create an async OpenAI client whose concurrent calls share HTTP/2 connections.
+
+    Not cached: the pool belongs to the event loop it is first used on.
+    """
+    if not api_key:
+        return None
+
+    import httpx
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=120.0,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=64)
+    )
+    return _openai().AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=5)
+
+@st.cache_resource
+def get_prompt_cache_stats() -> dict:
+    """Get process-wide prompt token counters for tracking prefix-cache hits."""
+    return {"prompt_tokens": 0, "cached_tokens": 0}
+
+def record_usage(stats: dict, usage):
+    """Add a completion's prompt token usage to the cache-hit counters."""
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    stats["prompt_tokens"] += usage.prompt_tokens or 0
+    stats["cached_tokens"] += getattr(details, "cached_tokens", 0) or 0
+
 class OpenAIService:
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.client = OpenAI(api_key=api_key) if api_key else None
+        self.client = _get_openai_client(api_key)
         self.model = "gpt-4o"
+        self.usage_stats = get_prompt_cache_stats()
 
-    def send_message(self, messages: list, system_prompt: str = None) -> str:
+    def send_message(self, messages: list, system_prompt: str = None, cache_key: str = None) -> str:
         """Send a message and get a response."""
         if not self.client:
-            return "Error: API key not configured. Please set your API key in Settings."
+            return NO_API_KEY_ERROR
 
         try:
-            api_messages = []
-            if system_prompt:
-                api_messages.append({"role": "system", "content": system_prompt})
-            api_messages.extend([{"role": m["role"], "content": m["content"]} for m in messages])
-
             response = self.client.chat.completions.create(
-                model=self.model,
-                max_tokens=4096,
-                messages=api_messages
+                **build_chat_request(self.model, messages, system_prompt, cache_key)
+            )
+            record_usage(self.usage_stats, response.usage)
+            return response.choices[0].message.content
+        except Exception as e:
+            return f"Error: {str(e)}"
+
+    def stream_message(self, messages: list, system_prompt: str = None, cache_key: str = None):
+        """Send a message and yield the response text as it is generated."""
+        if not self.client:
+            yield NO_API_KEY_ERROR
+            return
+
+        try:
+            stream = self.client.chat.completions.create(
+                stream=True,
+                **build_chat_request(self.model, messages, system_prompt, cache_key)
             )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            yield f"Error: {str(e)}"
+
+# Requests one async service keeps in flight at once; running every meeting
+# together would otherwise fire one call per speaker per meeting and hit rate limits
+MAX_CONCURRENT_REQUESTS = 10
+
+class AsyncOpenAIService:
+    """Async counterpart of OpenAIService for fanning out independent calls.
+
+    The underlying HTTP pool is bound to the event loop that first uses it, so
+    create one service per ``asyncio.run`` and use it as an async context
+    manager so the pool is closed before the loop goes away.
+    """
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        self.client = _new_async_openai_client(api_key)
+        self.model = "gpt-4o"
+        self.usage_stats = get_prompt_cache_stats()
+        self.request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def send_message(self, messages: list, system_prompt: str = None, cache_key: str = None) -> str:
+        """Send a message and get a response."""
+        if not self.client:
+            return NO_API_KEY_ERROR
+
+        try:
+            async with self.request_slots:
+                response = await self.client.chat.completions.create(
+                    **build_chat_request(self.model, messages, system_prompt, cache_key)
+                )
+            record_usage(self.usage_stats, response.usage)
             return response.choices[0].message.content
         except Exception as e:
             return f"Error: {str(e)}"
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self.client:
+            await self.client.close()
+
+async def asend_batch(service: AsyncOpenAIService, batch: list, cache_key: str = None) -> list:
+    """Send independent message lists concurrently, then close the service."""
+    async with service:
+        return await asyncio.gather(*[service.send_message(messages, cache_key=cache_key) for messages in batch])
+
+def cached_send(service: OpenAIService, messages: list, system_prompt: str = None,
+                cache_key: str = None, use_cache: bool = True, accept=None) -> str:
+    """Send a message, reusing the stored response to an identical request.
+
+    Meant for the people, research and report calls, whose only input is
+    session content; the discovery chat is deliberately left uncached.
+    Pass ``use_cache=False`` to force a fresh response (it replaces the stored one).
+    ``accept`` is called with every response, stored or fresh; only responses
+    it returns True for are stored, and a stored one it rejects is dropped
+    and fetched again.
+    """
+    request = _dumps({"model": service.model, "system": system_prompt, "messages": messages})
+    cache_file = get_response_cache_dir() / f"{hashlib.sha256(request).hexdigest()}.txt"
+    if use_cache and cache_file.exists():
+        response = cache_file.read_text(encoding="utf-8")
+        if not accept or accept(response):
+            return response
+        cache_file.unlink(missing_ok=True)
+
+    response = service.send_message(messages, system_prompt, cache_key)
+    accepted = accept(response) if accept else True
+    if accepted and not response.startswith("Error:"):
+        _atomic_write(cache_file, response.encode("utf-8"))
+    return response
+
+def build_cached_messages(summary: str, task_instruction: str = None, system_prompt: str = None) -> list:
+    """Build messages that lead with the executive summary as a shared prefix.
+
+    The summary block is byte-identical across the people, research and meeting
+    calls, so the provider's prefix cache can reuse it; only the short
+    stage-specific instruction differs.
+    """
+    messages = [{"role": "system", "content": f"Executive summary:\n{summary}"}]
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    if task_instruction:
+        messages.append({"role": "user", "content": task_instruction})
+    return messages
+
 # ============================================================
 # INITIALIZE SESSION STATE
 # ============================================================
@@ -331,30 +741,65 @@ def load_current_session_data():
     st.session_state.people = data.get('people', [])
     st.session_state.research_findings = data.get('research_findings', [])
     st.session_state.meetings = data.get('meetings', [])
+    # Kept up to date as meetings finish or reset, so views need not rescan
+    st.session_state.completed_meeting_count = sum(1 for m in st.session_state.meetings if m['is_complete'])
     st.session_state.final_report = data.get('final_report', '')
     st.session_state.report_chat_messages = data.get('report_chat_messages', [])
-
-def save_current_session_data():
-    """Save current session data."""
-    data = {
-        "messages": st.session_state.messages,
-        "summary": st.session_state.summary,
-        "people": st.session_state.people,
-        "research_findings": st.session_state.research_findings,
-        "meetings": st.session_state.meetings,
-        "final_report": st.session_state.final_report,
-        "report_chat_messages": st.session_state.report_chat_messages
-    }
+    # Pending meeting sub-reports, keyed by meeting id; views that show
+    # summaries restart any that are missing
+    st.session_state.summary_futures = {}
+    st.session_state.data_version = 0
+    # data_version restarts for every loaded session, so caches keyed on it must too
+    st.session_state.export_cache = None
+    st.session_state.full_context_cache = None
+    st.session_state.api_messages = []
+
+def save_current_session_data(*keys: str):
+    """Write the given parts of the current session."""
+    st.session_state.data_version += 1
+    data = {key: st.session_state[key] for key in keys}
     save_session_data(st.session_state.current_session_id, data)
 
-def get_api_service() -> OpenAIService:
-    """Get the OpenAI API service."""
-    return OpenAIService(st.session_state.api_key)
+def save_current_meeting(meeting: dict):
+    """Write one meeting of the current session, leaving the others untouched."""
+    st.session_state.data_version += 1
+    save_meeting(st.session_state.current_session_id, meeting)
+
+def append_current_message(message: dict):
+    """Add a discovery chat message to the current session and persist it."""
+    st.session_state.messages.append(message)
+    append_message(st.session_state.current_session_id, message)
+
+def get_discovery_api_messages() -> list:
+    """Get the discovery chat as API messages, converting only new messages."""
+    api_messages = st.session_state.api_messages
+    messages = st.session_state.messages
+    if len(api_messages) > len(messages):
+        api_messages.clear()
+    api_messages.extend({"role": m["role"], "content": m["content"]} for m in messages[len(api_messages):])
+    return api_messages
+
+@st.cache_resource
+def get_api_service(api_key: str) -> OpenAIService:
+    """Get the OpenAI API service for an API key, shared across reruns."""
+    return OpenAIService(api_key)
+
+def get_async_api_service() -> AsyncOpenAIService:
+    """Get a single-use async OpenAI API service."""
+    return AsyncOpenAIService(st.session_state.api_key)
+
+def rerun_view():
+    """Rerun just the current view's fragment, or the whole app when not in a fragment rerun."""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
 
 # ============================================================
 # STAGE VIEWS
 # ============================================================
 
+@st.fragment
 def discovery_view():
     """Discovery chat view."""
     st.header("💡 Discovery")
@@ -368,21 +813,22 @@ def discovery_view():
     # Chat input
     if prompt := st.chat_input("Type your message...", disabled=st.session_state.is_loading):
         # Add user message
-        st.session_state.messages.append({"role": "user", "content": prompt})
+        append_current_message({"role": "user", "content": prompt})
+        with st.chat_message("user"):
+            st.write(prompt)
 
         # Get AI response
         st.session_state.is_loading = True
-        service = get_api_service()
+        service = get_api_service(st.session_state.api_key)
 
         # Add discovery prompt to conversation
-        discovery_messages = st.session_state.messages.copy()
-        discovery_messages.append({"role": "user", "content": get_prompt("discovery-message")})
+        discovery_messages = [*get_discovery_api_messages(), {"role": "user", "content": get_prompt("discovery-message")}]
 
-        response = service.send_message(discovery_messages)
-        st.session_state.messages.append({"role": "assistant", "content": response})
+        with st.chat_message("assistant"):
+            response = st.write_stream(service.stream_message(discovery_messages))
+        append_current_message({"role": "assistant", "content": response})
         st.session_state.is_loading = False
-        save_current_session_data()
-        st.rerun()
+        rerun_view()
 
     # Next button
     st.divider()
@@ -394,18 +840,19 @@ def discovery_view():
 def generate_summary():
     """Generate executive summary from discovery chat."""
     st.session_state.is_generating_summary = True
-    service = get_api_service()
+    service = get_api_service(st.session_state.api_key)
 
-    summary_messages = st.session_state.messages.copy()
-    summary_messages.append({"role": "user", "content": get_prompt("discovery-summarize")})
+    summary_messages = [*get_discovery_api_messages(), {"role": "user", "content": get_prompt("discovery-summarize")}]
 
-    response = service.send_message(summary_messages)
+    with st.chat_message("assistant"):
+        response = st.write_stream(service.stream_message(summary_messages))
     st.session_state.summary = response
     st.session_state.is_generating_summary = False
     st.session_state.current_stage = "task"
-    save_current_session_data()
+    save_current_session_data("summary")
     st.rerun()
 
+@st.fragment
 def task_view():
     """Task/Summary view."""
     st.header("📄 Task Summary")
@@ -419,9 +866,9 @@ def task_view():
             new_summary = st.text_area("Summary", st.session_state.summary, height=200)
             if st.button("Save Changes"):
                 st.session_state.summary = new_summary
-                save_current_session_data()
+                save_current_session_data("summary")
                 st.success("Summary saved!")
-                st.rerun()
+                rerun_view()
     else:
         st.info("No summary generated yet. Go to Discovery to chat and generate a summary.")
 
@@ -430,38 +877,116 @@ def task_view():
     col1, col2 = st.columns([3, 1])
     with col2:
         if st.button("Identify Team →", type="primary", disabled=not st.session_state.summary):
-            generate_people()
+            generate_people_and_research()
+
+_JSON_CLOSERS = {"[": "]", "{": "}"}
+
+def extract_json(response: str, opener: str = "["):
+    """Parse the first balanced JSON array (or object, with ``opener="{"``) in a reply.
+
+    A single pass tracks bracket depth, ignoring brackets inside strings.
+    Returns None when the reply holds no complete value.
+    """
+    start = response.find(opener)
+    if start == -1:
+        return None
+
+    closer = _JSON_CLOSERS[opener]
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(response)):
+        c = response[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == opener:
+            depth += 1
+        elif c == closer:
+            depth -= 1
+            if depth == 0:
+                return _loads(response[start:i + 1])
+    return None
+
+def build_people_messages(summary: str) -> list:
+    """Build the request for identifying team members."""
+    user_prompt = render_prompt("people-user-prompt", EXECUTIVE_SUMMARY=SUMMARY_REFERENCE)
+    system_prompt = get_prompt("people-system-prompt")
+    return build_cached_messages(summary, user_prompt, system_prompt)
+
+def set_people(people_data: list):
+    """Store parsed team members in session state."""
+    st.session_state.people = [
+        {"id": uuid.uuid4().hex, "title": p["title"], "description": p["description"]}
+        for p in people_data[:5]
+    ]
+
+def apply_people_response(response: str) -> bool:
+    """Parse team members from a response into session state; return whether it parsed."""
+    try:
+        people_data = extract_json(response)
+        if people_data:
+            set_people(people_data)
+            return True
+    except Exception as e:
+        st.error(f"Error parsing people: {e}")
+    return False
 
-def generate_people():
+def generate_people(use_cache: bool = True):
     """Generate team members based on task."""
     st.session_state.is_analyzing_people = True
-    service = get_api_service()
+    service = get_api_service(st.session_state.api_key)
 
-    user_prompt = get_prompt("people-user-prompt").replace("{EXECUTIVE_SUMMARY}", st.session_state.summary)
-    system_prompt = get_prompt("people-system-prompt")
+    messages = build_people_messages(st.session_state.summary)
+    cached_send(service, messages, cache_key="executive-summary", use_cache=use_cache, accept=apply_people_response)
 
-    messages = [{"role": "user", "content": user_prompt}]
-    response = service.send_message(messages, system_prompt)
+    st.session_state.is_analyzing_people = False
+    st.session_state.current_stage = "people"
+    save_current_session_data("people")
+    st.rerun()
+
+def build_people_research_messages(summary: str) -> list:
+    """Build the single request for both team members and research findings."""
+    user_prompt = render_prompt("people-research-combined", EXECUTIVE_SUMMARY=SUMMARY_REFERENCE)
+    return build_cached_messages(summary, user_prompt)
 
-    # Parse JSON response
+def apply_people_research_response(response: str) -> bool:
+    """Parse team members and research findings from one response into session state; return whether both parsed."""
     try:
-        # Find JSON array in response
-        import re
-        json_match = re.search(r'\[[\s\S]*\]', response)
-        if json_match:
-            people_data = json.loads(json_match.group())
-            st.session_state.people = [
-                {"id": str(uuid.uuid4()), "title": p["title"], "description": p["description"]}
-                for p in people_data[:5]
-            ]
+        data = extract_json(response, "{")
+        if data:
+            if data.get("people"):
+                set_people(data["people"])
+            if data.get("research"):
+                set_research_findings(data["research"])
+            return bool(data.get("people") and data.get("research"))
     except Exception as e:
-        st.error(f"Error parsing people: {e}")
+        st.error(f"Error parsing team and research: {e}")
+    return False
+
+def generate_people_and_research():
+    """Generate team members and research findings in one step."""
+    st.session_state.is_analyzing_people = True
+    st.session_state.is_searching = True
+
+    service = get_api_service(st.session_state.api_key)
+    messages = build_people_research_messages(st.session_state.summary)
+    with st.spinner("Analyzing team & gathering research…"):
+        cached_send(service, messages, cache_key="executive-summary", accept=apply_people_research_response)
 
     st.session_state.is_analyzing_people = False
+    st.session_state.is_searching = False
     st.session_state.current_stage = "people"
-    save_current_session_data()
+    save_current_session_data("people", "research_findings")
     st.rerun()
 
+@st.fragment
 def people_view():
     """People/Team view."""
     st.header("👥 Team Members")
@@ -478,9 +1003,9 @@ def people_view():
                 if st.button(f"Save###{i}", key=f"save_{i}"):
                     st.session_state.people[i]['title'] = new_title
                     st.session_state.people[i]['description'] = new_desc
-                    save_current_session_data()
+                    save_current_session_data("people")
                     st.success("Saved!")
-                    st.rerun()
+                    rerun_view()
     else:
         st.info("No team members identified yet. Generate a summary first, then identify the team.")
 
@@ -488,47 +1013,61 @@ def people_view():
     col1, col2, col3 = st.columns([2, 1, 1])
     with col2:
         if st.button("🔄 Regenerate", disabled=not st.session_state.summary):
-            generate_people()
+            generate_people(use_cache=False)
 
     # Next button
     with col3:
         if st.button("Research →", type="primary", disabled=not st.session_state.people):
-            generate_research()
-
-def generate_research():
-    """Generate research findings."""
-    st.session_state.is_searching = True
-    service = get_api_service()
+            # Research is normally fetched together with the team
+            if st.session_state.research_findings:
+                st.session_state.current_stage = "research"
+                st.rerun()
+            else:
+                generate_research()
 
-    user_prompt = get_prompt("research-user-prompt").replace("{EXECUTIVE_SUMMARY}", st.session_state.summary)
+def build_research_messages(summary: str) -> list:
+    """Build the request for finding research precedents."""
+    user_prompt = render_prompt("research-user-prompt", EXECUTIVE_SUMMARY=SUMMARY_REFERENCE)
     system_prompt = get_prompt("research-system-prompt")
+    return build_cached_messages(summary, user_prompt, system_prompt)
+
+def set_research_findings(findings_data: list):
+    """Store parsed research findings in session state."""
+    st.session_state.research_findings = [
+        {
+            "id": uuid.uuid4().hex,
+            "topic": f["topic"],
+            "description": f["description"],
+            "citation": f["citation"]
+        }
+        for f in findings_data[:10]
+    ]
 
-    messages = [{"role": "user", "content": user_prompt}]
-    response = service.send_message(messages, system_prompt)
-
-    # Parse JSON response
+def apply_research_response(response: str) -> bool:
+    """Parse research findings from a response into session state; return whether it parsed."""
     try:
-        import re
-        json_match = re.search(r'\[[\s\S]*\]', response)
-        if json_match:
-            findings_data = json.loads(json_match.group())
-            st.session_state.research_findings = [
-                {
-                    "id": str(uuid.uuid4()),
-                    "topic": f["topic"],
-                    "description": f["description"],
-                    "citation": f["citation"]
-                }
-                for f in findings_data[:10]
-            ]
+        findings_data = extract_json(response)
+        if findings_data:
+            set_research_findings(findings_data)
+            return True
     except Exception as e:
         st.error(f"Error parsing research: {e}")
+    return False
+
+def generate_research(use_cache: bool = True):
+    """Generate research findings."""
+    st.session_state.is_searching = True
+    service = get_api_service(st.session_state.api_key)
+
+    messages = build_research_messages(st.session_state.summary)
+    cached_send(service, messages, cache_key="executive-summary", use_cache=use_cache, accept=apply_research_response)
 
     st.session_state.is_searching = False
     st.session_state.current_stage = "research"
-    save_current_session_data()
+    save_current_session_data("research_findings")
     st.rerun()
 
+@st.fragment
 def research_view():
     """Research findings view."""
     st.header("🌍 Research")
@@ -546,7 +1085,7 @@ def research_view():
     col1, col2, col3 = st.columns([2, 1, 1])
     with col2:
         if st.button("🔄 Regenerate", disabled=not st.session_state.summary):
-            generate_research()
+            generate_research(use_cache=False)
 
     # Next button
     with col3:
@@ -559,26 +1098,23 @@ def initialize_meetings():
         meetings = []
         for finding in st.session_state.research_findings:
             meeting = {
-                "id": str(uuid.uuid4()),
+                "id": uuid.uuid4().hex,
                 "topic": finding['topic'],
                 "description": finding['description'],
-                "messages": [{
-                    "id": str(uuid.uuid4()),
-                    "participant_name": f"Meeting Topic: {finding['topic']}",
-                    "content": finding['description'],
-                    "participant_id": None
-                }],
+                "messages": [],
                 "is_complete": False,
                 "turn_count": 0,
                 "summary_report": None
             }
             meetings.append(meeting)
         st.session_state.meetings = meetings
-        save_current_session_data()
+        st.session_state.completed_meeting_count = 0
+        save_current_session_data("meetings")
 
     st.session_state.current_stage = "meetings"
     st.rerun()
 
+@st.fragment
 def meetings_view():
     """Meetings simulation view."""
     st.header("💬 Meetings")
@@ -588,6 +1124,9 @@ def meetings_view():
         st.info("No meetings initialized. Complete research first.")
         return
 
+    resume_meeting_summaries()
+    resolve_meeting_summaries()
+
     # Meeting selector
     meeting_options = [f"{m['topic']}" for m in st.session_state.meetings]
     selected_idx = st.selectbox(
@@ -604,8 +1143,6 @@ def meetings_view():
     st.divider()
 
     for msg in meeting['messages']:
-        if msg['participant_name'].startswith("Meeting Topic:"):
-            continue
         with st.chat_message("assistant" if msg['participant_id'] else "user"):
             st.markdown(f"**{msg['participant_name']}**")
             st.write(msg['content'])
@@ -623,96 +1160,121 @@ def meetings_view():
 
     with col3:
         if st.button("🔄 Reset Meeting"):
-            st.session_state.meetings[selected_idx]['messages'] = [{
-                "id": str(uuid.uuid4()),
-                "participant_name": f"Meeting Topic: {meeting['topic']}",
-                "content": meeting['description'],
-                "participant_id": None
-            }]
+            if meeting['is_complete']:
+                st.session_state.completed_meeting_count -= 1
+            st.session_state.meetings[selected_idx]['messages'] = []
             st.session_state.meetings[selected_idx]['is_complete'] = False
             st.session_state.meetings[selected_idx]['turn_count'] = 0
             st.session_state.meetings[selected_idx]['summary_report'] = None
-            save_current_session_data()
-            st.rerun()
+            st.session_state.summary_futures.pop(meeting['id'], None)
+            save_current_meeting(meeting)
+            rerun_view()
 
     # Show summary if complete
     if meeting['summary_report']:
         st.divider()
         st.subheader("Meeting Summary")
         st.markdown(meeting['summary_report'])
+    elif meeting['id'] in st.session_state.summary_futures:
+        st.divider()
+        st.info("Meeting summary is being generated in the background...")
 
     # Next button
     st.divider()
     col1, col2 = st.columns([3, 1])
     with col2:
-        completed_meetings = sum(1 for m in st.session_state.meetings if m['is_complete'])
-        if st.button(f"Generate Report →", type="primary", disabled=completed_meetings == 0):
+        if st.button(f"Generate Report →", type="primary", disabled=st.session_state.completed_meeting_count == 0):
             st.session_state.current_stage = "report"
             st.rerun()
 
-def run_single_meeting(meeting_idx: int, max_turns: int = 10):
-    """Run a single meeting simulation."""
-    st.session_state.is_running_meetings = True
-    service = get_api_service()
-    meeting = st.session_state.meetings[meeting_idx]
-
-    with st.spinner(f"Running meeting: {meeting['topic']}..."):
-        while meeting['turn_count'] < max_turns:
-            # Select next participant (round-robin through people)
-            person_idx = meeting['turn_count'] % len(st.session_state.people)
-            person = st.session_state.people[person_idx]
-
-            # Build conversation history
-            history = build_meeting_history(person, meeting)
+async def arun_single_meeting(service: AsyncOpenAIService, meeting: dict, people: list, max_turns: int = 10) -> dict:
+    """Simulate one meeting on a copy of it and return the finished copy."""
+    meeting = {**meeting, 'messages': list(meeting['messages'])}
+
+    # Turns stay sequential so each expert answers everything said before them;
+    # the concurrency comes from running separate meetings side by side
+    while meeting['turn_count'] < max_turns:
+        person = people[meeting['turn_count'] % len(people)]
+        # A speaker's history only grows between their turns, so a per-speaker
+        # cache key keeps their earlier turns warm in the provider's prefix cache
+        response = await service.send_message(
+            build_meeting_history(person, meeting), cache_key=f"meeting-{meeting['id']}-{person['id']}"
+        )
 
-            # Get response
-            response = service.send_message(history)
+        # Add message to meeting
+        meeting['messages'].append({
+            "participant_name": person['title'],
+            "content": response,
+            "participant_id": person['id']
+        })
+        meeting['turn_count'] += 1
+
+    meeting['is_complete'] = True
+    return meeting
+
+async def arun_meetings(meeting_indices: list, max_turns: int = 10) -> list:
+    """Simulate several meetings concurrently on one async client."""
+    meetings = st.session_state.meetings
+    people = st.session_state.people
+    async with get_async_api_service() as service:
+        return await asyncio.gather(*[
+            arun_single_meeting(service, meetings[idx], people, max_turns) for idx in meeting_indices
+        ])
+
+def run_meetings(meeting_indices: list, max_turns: int = 10):
+    """Run meeting simulations concurrently, then start their summaries."""
+    if not meeting_indices:
+        return
+    if not st.session_state.people:
+        st.error("Identify team members before running meetings.")
+        return
 
-            # Add message to meeting
-            meeting['messages'].append({
-                "id": str(uuid.uuid4()),
-                "participant_name": person['title'],
-                "content": response,
-                "participant_id": person['id']
-            })
+    st.session_state.is_running_meetings = True
 
-            meeting['turn_count'] += 1
-            save_current_session_data()
+    topics = ", ".join(st.session_state.meetings[idx]['topic'] for idx in meeting_indices)
+    with st.spinner(f"Running meeting: {topics}..."):
+        results = asyncio.run(arun_meetings(meeting_indices, max_turns))
 
-        # Generate meeting summary
-        meeting['is_complete'] = True
-        generate_meeting_summary(meeting_idx)
+    # Session state is only touched once every meeting has finished
+    for idx, meeting in zip(meeting_indices, results):
+        if not st.session_state.meetings[idx]['is_complete']:
+            st.session_state.completed_meeting_count += 1
+        st.session_state.meetings[idx] = meeting
+        save_current_meeting(meeting)
+    generate_meeting_summaries(meeting_indices)
 
     st.session_state.is_running_meetings = False
-    st.rerun()
+    rerun_view()
+
+def run_single_meeting(meeting_idx: int, max_turns: int = 10):
+    """Run a single meeting simulation."""
+    run_meetings([meeting_idx], max_turns)
 
 def run_all_meetings():
     """Run all incomplete meetings."""
-    for idx, meeting in enumerate(st.session_state.meetings):
-        if not meeting['is_complete']:
-            run_single_meeting(idx)
+    run_meetings([idx for idx, meeting in enumerate(st.session_state.meetings) if not meeting['is_complete']])
 
 def build_meeting_history(person: dict, meeting: dict) -> list:
     """Build conversation history for a meeting participant."""
-    prompt = get_prompt("meeting-expert-instructions")
-    prompt = prompt.replace("{PERSON_DESCRIPTION}", person['description'])
-    prompt = prompt.replace("{SUMMARY}", st.session_state.summary)
-    prompt = prompt.replace("{MEETING_DESCRIPTION}", meeting['description'])
-
-    history = [
-        {"role": "user", "content": prompt},
-        {"role": "assistant", "content": "Understood. I'm ready to participate in the meeting."}
-    ]
+    prompt = render_prompt(
+        "meeting-expert-instructions",
+        PERSON_DESCRIPTION=person['description'],
+        SUMMARY=SUMMARY_REFERENCE,
+        MEETING_DESCRIPTION=meeting['description']
+    )
+
+    # The persona goes in as a system prompt, so there is no user instruction
+    # to acknowledge and the history holds only the real dialogue
+    history = build_cached_messages(st.session_state.summary, system_prompt=prompt)
 
     # Add meeting messages
-    for msg in meeting['messages'][1:]:  # Skip topic message
-        if msg['participant_id'] or msg['participant_name'] == "You":
-            history.append({
-                "role": "user",
-                "content": f"{msg['participant_name']} said: {msg['content']}\n\nPlease respond as the {person['title']}."
-            })
-
-    if len(meeting['messages']) == 1:
+    for msg in meeting['messages']:
+        history.append({
+            "role": "user",
+            "content": f"{msg['participant_name']} said: {msg['content']}\n\nPlease respond as the {person['title']}."
+        })
+
+    if not meeting['messages']:
         history.append({
             "role": "user",
             "content": "Please share your initial thoughts on this feature."
@@ -720,28 +1282,79 @@ def build_meeting_history(person: dict, meeting: dict) -> list:
 
     return history
 
-def generate_meeting_summary(meeting_idx: int):
-    """Generate a summary for a meeting."""
-    service = get_api_service()
-    meeting = st.session_state.meetings[meeting_idx]
+def build_meeting_summary_messages(meeting: dict) -> list:
+    """Build the sub-report request for a meeting."""
+    transcript = "".join(f"\n\n[{msg['participant_name']}]:\n{msg['content']}" for msg in meeting['messages'])
 
-    # Build transcript
-    transcript = ""
-    for msg in meeting['messages'][1:]:  # Skip topic
-        if msg['participant_id'] or msg['participant_name'] == "You":
-            transcript += f"\n\n[{msg['participant_name']}]:\n{msg['content']}"
+    prompt = render_prompt(
+        "meeting-sub-report-prompt",
+        MEETING_TOPIC=meeting['topic'],
+        MEETING_DESCRIPTION=meeting['description'],
+        TRANSCRIPT=transcript
+    )
+
+    return [{"role": "user", "content": prompt}]
 
-    prompt = get_prompt("meeting-sub-report-prompt")
-    prompt = prompt.replace("{MEETING_TOPIC}", meeting['topic'])
-    prompt = prompt.replace("{MEETING_DESCRIPTION}", meeting['description'])
-    prompt = prompt.replace("{TRANSCRIPT}", transcript)
+def generate_meeting_summaries(meeting_indices: list):
+    """Start the sub-reports of several meetings as one concurrent background batch."""
+    meetings = [st.session_state.meetings[idx] for idx in meeting_indices]
+    batch = [build_meeting_summary_messages(meeting) for meeting in meetings]
+    future = _get_report_executor().submit(
+        asyncio.run, asend_batch(get_async_api_service(), batch, cache_key="meeting-summary")
+    )
 
-    messages = [{"role": "user", "content": prompt}]
-    response = service.send_message(messages)
+    # Each meeting remembers where its reply sits in the batch result
+    for position, meeting in enumerate(meetings):
+        st.session_state.summary_futures[meeting['id']] = (future, position)
 
-    st.session_state.meetings[meeting_idx]['summary_report'] = response
-    save_current_session_data()
+def resume_meeting_summaries():
+    """Restart sub-reports of finished meetings whose summary was never stored.
 
+    Summaries are generated in the background, so one is lost if the browser
+    session ends before it arrives.
+    """
+    if not st.session_state.api_key:
+        return
+    futures = st.session_state.summary_futures
+    missing = [
+        idx for idx, meeting in enumerate(st.session_state.meetings)
+        if meeting['is_complete'] and not meeting['summary_report'] and meeting['id'] not in futures
+    ]
+    if missing:
+        generate_meeting_summaries(missing)
+
+@st.cache_resource
+def _get_report_executor() -> ThreadPoolExecutor:
+    """Shared executor for meeting sub-reports."""
+    return ThreadPoolExecutor(max_workers=4)
+
+def drop_meeting_summaries(keep_finished: bool = True):
+    """Abandon pending sub-reports, first storing those that have arrived unless told not to.
+
+    Called before leaving a session, so no reply is written into a session
+    that is no longer loaded; the missing ones are restarted when it is viewed again.
+    """
+    if keep_finished:
+        resolve_meeting_summaries()
+    for future, _ in st.session_state.summary_futures.values():
+        future.cancel()
+    st.session_state.summary_futures = {}
+
+def resolve_meeting_summaries(wait: bool = False) -> int:
+    """Store finished meeting sub-reports; return how many are still pending."""
+    futures = st.session_state.summary_futures
+    for meeting in st.session_state.meetings:
+        if meeting['id'] not in futures:
+            continue
+        future, position = futures[meeting['id']]
+        if not (wait or future.done()):
+            continue
+        meeting['summary_report'] = future.result()[position]
+        del futures[meeting['id']]
+        save_current_meeting(meeting)
+    return sum(1 for m in st.session_state.meetings if m['id'] in futures)
+
+@st.fragment
 def report_view():
     """Final report view."""
     st.header("📊 Final Report")
@@ -750,6 +1363,9 @@ def report_view():
     if st.session_state.final_report:
         st.markdown(st.session_state.final_report)
 
+        if st.button("🔄 Regenerate Report"):
+            generate_final_report(use_cache=False)
+
         # Report chat
         st.divider()
         st.subheader("💬 Ask Questions About the Report")
@@ -760,6 +1376,8 @@ def report_view():
 
         if prompt := st.chat_input("Ask a question about the report..."):
             st.session_state.report_chat_messages.append({"role": "user", "content": prompt})
+            with st.chat_message("user"):
+                st.write(prompt)
 
             # Build context
             full_context = build_full_meeting_context()
@@ -777,7 +1395,7 @@ USER QUESTION:
 
 Please answer the user's question by searching through all the meeting transcripts and the final report. Include specific quotes from experts when relevant."""
 
-            service = get_api_service()
+            service = get_api_service(st.session_state.api_key)
             system_prompt = """You are an AI assistant helping to answer questions about a policy report and the meetings that led to it.
 
 You have access to:
@@ -792,14 +1410,22 @@ When answering questions:
 - Be thorough but concise
 - If asked about specific topics, search all meetings for related discussions"""
 
-            response = service.send_message([{"role": "user", "content": context_message}], system_prompt)
+            with st.chat_message("assistant"):
+                response = st.write_stream(
+                    service.stream_message([{"role": "user", "content": context_message}], system_prompt, cache_key="report-chat")
+                )
             st.session_state.report_chat_messages.append({"role": "assistant", "content": response})
-            save_current_session_data()
-            st.rerun()
+            save_current_session_data("report_chat_messages")
+            rerun_view()
     else:
+        resume_meeting_summaries()
+        if st.session_state.summary_futures:
+            with st.spinner("Waiting for meeting summaries..."):
+                resolve_meeting_summaries(wait=True)
+
         # Show available summaries
-        completed = [m for m in st.session_state.meetings if m['summary_report']]
-        st.info(f"{len(completed)}/{len(st.session_state.meetings)} meetings have summaries")
+        completed = sum(1 for m in st.session_state.meetings if m['summary_report'])
+        st.info(f"{completed}/{len(st.session_state.meetings)} meetings have summaries")
 
         if completed:
             if st.button("🔄 Generate Final Report", type="primary"):
@@ -808,28 +1434,34 @@ When answering questions:
             st.warning("Complete at least one meeting to generate a report.")
 
 def build_full_meeting_context() -> str:
-    """Build context from all meetings."""
-    context = ""
+    """Build context from all meetings, reused while the meetings are unchanged."""
+    digest = hashlib.sha256(_dumps(st.session_state.meetings)).digest()
+    cached = st.session_state.get('full_context_cache')
+    if cached and cached[0] == digest:
+        return cached[1]
+
+    parts = []
     for i, meeting in enumerate(st.session_state.meetings):
-        context += f"\n\n=== MEETING {i+1}: {meeting['topic']} ===\n"
-        context += f"Description: {meeting['description']}\n"
-        context += "Meeting Transcript:\n"
+        parts.append(f"\n\n=== MEETING {i+1}: {meeting['topic']} ===\n")
+        parts.append(f"Description: {meeting['description']}\n")
+        parts.append("Meeting Transcript:\n")
 
         for msg in meeting['messages']:
-            if not msg['participant_name'].startswith("Meeting Topic:"):
-                context += f"\n[{msg['participant_name']}]: {msg['content']}"
+            parts.append(f"\n[{msg['participant_name']}]: {msg['content']}")
 
         if meeting.get('summary_report'):
-            context += f"\n\nMeeting Summary: {meeting['summary_report']}"
+            parts.append(f"\n\nMeeting Summary: {meeting['summary_report']}")
 
-        context += "\n\n---"
+        parts.append("\n\n---")
 
+    context = "".join(parts)
+    st.session_state.full_context_cache = (digest, context)
     return context
 
-def generate_final_report():
+def generate_final_report(use_cache: bool = True):
     """Generate the final comprehensive report."""
     st.session_state.is_generating_report = True
-    service = get_api_service()
+    service = get_api_service(st.session_state.api_key)
 
     # Collect summaries
     summaries = []
@@ -840,26 +1472,61 @@ def generate_final_report():
     combined_summaries = "\n\n---\n\n".join(summaries)
 
     system_prompt = get_prompt("report-system-prompt")
-    user_prompt = get_prompt("report-user-prompt")
-    user_prompt = user_prompt.replace("{DISCOVERY_SUMMARY}", st.session_state.summary)
-    user_prompt = user_prompt.replace("{COMBINED_SUB_REPORTS}", combined_summaries)
+    user_prompt = render_prompt(
+        "report-user-prompt",
+        DISCOVERY_SUMMARY=st.session_state.summary,
+        COMBINED_SUB_REPORTS=combined_summaries
+    )
 
     messages = [{"role": "user", "content": user_prompt}]
-    response = service.send_message(messages, system_prompt)
+    response = cached_send(service, messages, system_prompt, cache_key="report", use_cache=use_cache)
 
     st.session_state.final_report = response
     st.session_state.is_generating_report = False
-    save_current_session_data()
+    save_current_session_data("final_report")
     st.rerun()
 
+def get_export() -> dict:
+    """Get the report preview and download files, rebuilt only after session data changes."""
+    export_key = (st.session_state.current_session_id, st.session_state.data_version)
+    cached = st.session_state.get('export_cache')
+    if cached and cached[0] == export_key:
+        return cached[1]
+
+    final_report = st.session_state.final_report
+    full_export = {
+        "summary": st.session_state.summary,
+        "people": st.session_state.people,
+        "research_findings": st.session_state.research_findings,
+        "meetings": st.session_state.meetings,
+        "final_report": final_report
+    }
+    export = {
+        "preview": final_report[:500] + "..." if len(final_report) > 500 else final_report,
+        "markdown": final_report.encode("utf-8"),
+        "json": _dumps_indented(full_export)
+    }
+    st.session_state.export_cache = (export_key, export)
+    return export
+
+def stamp_export(export_json: bytes) -> bytes:
+    """Add the current time as exported_at to the cached full-data export."""
+    # The cached JSON is an indented object ending in "\n}", so the key is
+    # spliced in before the closing brace instead of re-serializing everything
+    stamp = _dumps_indented({"exported_at": datetime.now().isoformat()})
+    return export_json[:-2] + b",\n" + stamp[2:]
+
+@st.fragment
 def export_view():
     """Export view for downloading the report."""
     st.header("📤 Export")
     st.caption("Download your report")
 
     if st.session_state.final_report:
+        export = get_export()
+
         st.subheader("Final Report")
-        st.markdown(st.session_state.final_report[:500] + "..." if len(st.session_state.final_report) > 500 else st.session_state.final_report)
+        st.markdown(export["preview"])
 
         # Download buttons
         col1, col2 = st.columns(2)
@@ -868,36 +1535,29 @@ def export_view():
             # Markdown download
             st.download_button(
                 label="📥 Download as Markdown",
-                data=st.session_state.final_report,
+                data=export["markdown"],
                 file_name="virtual_lab_report.md",
                 mime="text/markdown"
             )
 
         with col2:
             # Full export (JSON with all data)
-            full_export = {
-                "summary": st.session_state.summary,
-                "people": st.session_state.people,
-                "research_findings": st.session_state.research_findings,
-                "meetings": st.session_state.meetings,
-                "final_report": st.session_state.final_report,
-                "exported_at": datetime.now().isoformat()
-            }
             st.download_button(
                 label="📥 Download Full Data (JSON)",
-                data=json.dumps(full_export, indent=2),
+                data=stamp_export(export["json"]),
                 file_name="virtual_lab_full_export.json",
                 mime="application/json"
             )
     else:
         st.info("No report to export yet. Generate a final report first.")
 
+@st.fragment
 def prompts_view():
     """Prompts settings view."""
     st.header("⚙️ Prompts")
     st.caption("Customize AI prompts")
 
-    prompts = load_prompts()
+    prompts = dict(load_prompts())
 
     for prompt_id, content in prompts.items():
         with st.expander(prompt_id.replace("-", " ").title()):
@@ -915,8 +1575,9 @@ def prompts_view():
     if st.button("Reset to Defaults"):
         save_prompts(DEFAULT_PROMPTS)
         st.success("Reset to defaults!")
-        st.rerun()
+        rerun_view()
 
+@st.fragment
 def settings_view():
     """Settings view for API key."""
     st.header("🔑 Settings")
@@ -938,6 +1599,11 @@ def settings_view():
     # API key status
     if st.session_state.api_key:
         st.success("✅ API key is configured")
+
+        stats = get_prompt_cache_stats()
+        if stats["prompt_tokens"]:
+            hit_ratio = stats["cached_tokens"] / stats["prompt_tokens"]
+            st.caption(f"Prompt cache: {stats['cached_tokens']:,} of {stats['prompt_tokens']:,} prompt tokens served from cache ({hit_ratio:.0%})")
     else:
         st.warning("⚠️ No API key configured")
         st.markdown("""
@@ -956,79 +1622,86 @@ def settings_view():
 def render_sidebar():
     """Render the sidebar navigation."""
     with st.sidebar:
-        st.title("🧪 Virtual Lab")
+        sidebar_view()
 
-        # Session selector
-        sessions = load_sessions_metadata()
-        current_session = next((s for s in sessions if s['id'] == st.session_state.current_session_id), None)
-
-        st.subheader("Current Session")
-        session_names = [s['name'] for s in sessions]
-        selected_idx = session_names.index(current_session['name']) if current_session else 0
-
-        new_session_idx = st.selectbox(
-            "Session",
-            range(len(session_names)),
-            format_func=lambda x: session_names[x],
-            index=selected_idx,
-            label_visibility="collapsed"
-        )
+@st.fragment
+def sidebar_view():
+    """Sidebar contents; widget changes here rerun only the sidebar."""
+    st.title("🧪 Virtual Lab")
+
+    # Session selector
+    sessions = load_sessions_metadata()
+    current_session = next((s for s in sessions if s['id'] == st.session_state.current_session_id), None)
+
+    st.subheader("Current Session")
+    session_names = [s['name'] for s in sessions]
+    selected_idx = session_names.index(current_session['name']) if current_session else 0
+
+    new_session_idx = st.selectbox(
+        "Session",
+        range(len(session_names)),
+        format_func=lambda x: session_names[x],
+        index=selected_idx,
+        label_visibility="collapsed"
+    )
+
+    if sessions[new_session_idx]['id'] != st.session_state.current_session_id:
+        drop_meeting_summaries()
+        st.session_state.current_session_id = sessions[new_session_idx]['id']
+        load_current_session_data()
+        st.rerun()
 
-        if sessions[new_session_idx]['id'] != st.session_state.current_session_id:
-            save_current_session_data()
-            st.session_state.current_session_id = sessions[new_session_idx]['id']
+    # Session management
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("➕ New", use_container_width=True):
+            drop_meeting_summaries()
+            new_session = create_session(f"Session {len(sessions) + 1}")
+            st.session_state.current_session_id = new_session.id
             load_current_session_data()
             st.rerun()
 
-        # Session management
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("➕ New", use_container_width=True):
-                new_session = create_session(f"Session {len(sessions) + 1}")
-                st.session_state.current_session_id = new_session.id
-                load_current_session_data()
-                st.rerun()
-
-        with col2:
-            if st.button("🗑️ Delete", use_container_width=True, disabled=len(sessions) <= 1):
-                delete_session(st.session_state.current_session_id)
-                sessions = load_sessions_metadata()
-                st.session_state.current_session_id = sessions[0]['id']
-                load_current_session_data()
-                st.rerun()
+    with col2:
+        if st.button("🗑️ Delete", use_container_width=True, disabled=len(sessions) <= 1):
+            drop_meeting_summaries(keep_finished=False)
+            delete_session(st.session_state.current_session_id)
+            sessions = load_sessions_metadata()
+            st.session_state.current_session_id = sessions[0]['id']
+            load_current_session_data()
+            st.rerun()
 
-        st.divider()
+    st.divider()
 
-        # Navigation
-        stages = [
-            ("discovery", "💡", "Discovery"),
-            ("task", "📄", "Task"),
-            ("people", "👥", "People"),
-            ("research", "🌍", "Research"),
-            ("meetings", "💬", "Meetings"),
-            ("report", "📊", "Report"),
-        ]
+    # Navigation
+    stages = [
+        ("discovery", "💡", "Discovery"),
+        ("task", "📄", "Task"),
+        ("people", "👥", "People"),
+        ("research", "🌍", "Research"),
+        ("meetings", "💬", "Meetings"),
+        ("report", "📊", "Report"),
+    ]
 
-        for stage_id, icon, label in stages:
-            if st.button(f"{icon} {label}", use_container_width=True,
-                        type="primary" if st.session_state.current_stage == stage_id else "secondary"):
-                st.session_state.current_stage = stage_id
-                st.rerun()
+    for stage_id, icon, label in stages:
+        if st.button(f"{icon} {label}", use_container_width=True,
+                    type="primary" if st.session_state.current_stage == stage_id else "secondary"):
+            st.session_state.current_stage = stage_id
+            st.rerun()
 
-        st.divider()
+    st.divider()
 
-        # Settings
-        settings_stages = [
-            ("prompts", "⚙️", "Prompts"),
-            ("settings", "🔑", "API Key"),
-            ("export", "📤", "Export"),
-        ]
+    # Settings
+    settings_stages = [
+        ("prompts", "⚙️", "Prompts"),
+        ("settings", "🔑", "API Key"),
+        ("export", "📤", "Export"),
+    ]
 
-        for stage_id, icon, label in settings_stages:
-            if st.button(f"{icon} {label}", use_container_width=True,
-                        type="primary" if st.session_state.current_stage == stage_id else "secondary"):
-                st.session_state.current_stage = stage_id
-                st.rerun()
+    for stage_id, icon, label in settings_stages:
+        if st.button(f"{icon} {label}", use_container_width=True,
+                    type="primary" if st.session_state.current_stage == stage_id else "secondary"):
+            st.session_state.current_stage = stage_id
+            st.rerun()
 
 # ============================================================
 # MAIN APP
@@ -1049,7 +1722,9 @@ def main():
     # Render sidebar
     render_sidebar()
 
-    # Main content area
+    # Main content area. Each view is a fragment, so its own widgets rerun
+    # just that view, and edits within a view call rerun_view();
+    # navigation calls st.rerun() to redraw the whole app.
     stage = st.session_state.current_stage
 
     if stage == "discovery":
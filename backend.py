@@ -5,20 +5,59 @@ Flask-based REST API for the Virtual Lab application
 
 import os
 import json
+import asyncio
 import hashlib
+import hmac
+import re
+import sqlite3
+import threading
+import time
 import uuid
 from pathlib import Path
+from contextlib import contextmanager
 from datetime import datetime
-from functools import wraps
-from flask import Flask, request, jsonify, render_template, session
+from functools import lru_cache, wraps
+import httpx
+from flask import Flask, Response, current_app, request, jsonify, render_template, session, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from prompt_templates import SUMMARY_REFERENCE, fill_template, split_template
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ============================================================
+# JSON SERIALIZATION
+# ============================================================
+
+def dumps_json(data, indent: bool = False) -> bytes:
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None).encode()
+
+def loads_json(data):
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class FastJSONProvider(JSONProvider):
+    # Used by jsonify and request.json, so large session payloads skip stdlib json
+    def dumps(self, obj, **kwargs) -> str:
+        return dumps_json(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return loads_json(s)
 
 # ============================================================
 # FLASK APP CONFIGURATION
 # ============================================================
 
 app = Flask(__name__, static_folder='static', template_folder='templates')
+app.json = FastJSONProvider(app)
 app.secret_key = os.environ.get('SECRET_KEY', 'virtual-lab-secret-key-change-in-production')
 CORS(app)
 
@@ -26,9 +65,17 @@ CORS(app)
 # AUTHENTICATION
 # ============================================================
 
+PBKDF2_ITERATIONS = 200_000
+
+def hash_password(password: str, salt: bytes) -> bytes:
+    return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, PBKDF2_ITERATIONS)
+
+_admin_salt = os.urandom(16)
+
 USERS = {
     "TestUserAD": {
-        "password_hash": hashlib.sha256("ADPM1987@AD".encode()).hexdigest(),
+        "password_salt": _admin_salt,
+        "password_digest": hash_password("ADPM1987@AD", _admin_salt),
         "name": "Test User",
         "role": "admin"
     }
@@ -36,8 +83,8 @@ USERS = {
 
 def check_password(username: str, password: str) -> bool:
     if username in USERS:
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
-        return USERS[username]["password_hash"] == password_hash
+        user = USERS[username]
+        return hmac.compare_digest(user["password_digest"], hash_password(password, user["password_salt"]))
     return False
 
 def login_required(f):
@@ -45,29 +92,64 @@ def login_required(f):
     def decorated_function(*args, **kwargs):
         if 'user' not in session:
             return jsonify({"error": "Unauthorized"}), 401
-        return f(*args, **kwargs)
+        # ensure_sync lets the same decorator wrap async views
+        return current_app.ensure_sync(f)(*args, **kwargs)
     return decorated_function
 
 # ============================================================
 # FILE PATHS AND STORAGE
 # ============================================================
 
+# Paths are resolved and their directories created once per process
+@lru_cache(maxsize=1)
 def get_data_dir() -> Path:
     data_dir = Path.home() / ".virtual_lab"
     data_dir.mkdir(exist_ok=True)
     return data_dir
 
+@lru_cache(maxsize=1)
 def get_sessions_dir() -> Path:
     sessions_dir = get_data_dir() / "sessions"
     sessions_dir.mkdir(exist_ok=True)
     return sessions_dir
 
+@lru_cache(maxsize=1)
 def get_config_path() -> Path:
     return get_data_dir() / "config.json"
 
+@lru_cache(maxsize=1)
 def get_prompts_path() -> Path:
     return get_data_dir() / "prompts.json"
 
+@lru_cache(maxsize=1)
+def get_response_cache_dir() -> Path:
+    cache_dir = get_data_dir() / "response_cache"
+    cache_dir.mkdir(exist_ok=True)
+    return cache_dir
+
+# Parsed JSON files keyed by path, reused while (mtime, size) is unchanged
+_JSON_FILE_CACHE = {}
+
+def load_json_file(path: Path):
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _JSON_FILE_CACHE.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    data = loads_json(path.read_bytes())
+    _JSON_FILE_CACHE[path] = (key, data)
+    return data
+
+def write_json_file(path: Path, data, indent: bool = False):
+    # Serialize once and write it in one go to a temporary file, then rename it
+    # over the target so readers never see a half-written file
+    payload = dumps_json(data, indent)
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    with open(tmp_path, 'wb', buffering=65536) as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    _JSON_FILE_CACHE.pop(path, None)
+
 # ============================================================
 # CONFIGURATION MANAGEMENT
 # ============================================================
@@ -75,13 +157,11 @@ def get_prompts_path() -> Path:
 def load_config() -> dict:
     config_path = get_config_path()
     if config_path.exists():
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return load_json_file(config_path)
     return {"api_key": os.environ.get('OPENAI_API_KEY', '')}
 
 def save_config(config: dict):
-    with open(get_config_path(), 'w') as f:
-        json.dump(config, f, indent=2)
+    write_json_file(get_config_path(), config, indent=True)
 
 # ============================================================
 # PROMPTS CONFIGURATION
@@ -97,8 +177,8 @@ DEFAULT_PROMPTS = {
 
 Describe five people you would choose for this role. Make it diverse in the skillset. Be creative.
 
-Return your response as a JSON array with exactly 5 objects, each having "title" and "description" fields. Example format:
-[{"title": "Title Here", "description": "Description here"}, ...]""",
+Return your response as a JSON object whose "people" field is an array of exactly 5 objects, each having "title" and "description" fields. Example format:
+{"people": [{"title": "Title Here", "description": "Description here"}, ...]}""",
     "research-user-prompt": """You are working as a consultant for Abu Dhabi government. Your role is to conduct research and identify relevant precedents and examples that can inform policy and implementation strategies.
 
 You have been provided with an executive summary of a task that the user is working to accomplish:
@@ -107,8 +187,8 @@ You have been provided with an executive summary of a task that the user is work
 
 Your assignment is to research and find ten previous examples of similar work done by other nations, companies, organizations, or institutions that are relevant to accomplishing the task described in the executive summary.
 
-Return your response as a JSON array with exactly 10 objects, each having "topic", "description", and "citation" fields. Example format:
-[{"topic": "Topic Name", "description": "Detailed description", "citation": "Source URL or publication"}, ...]""",
+Return your response as a JSON object whose "findings" field is an array of exactly 10 objects, each having "topic", "description", and "citation" fields. Example format:
+{"findings": [{"topic": "Topic Name", "description": "Detailed description", "citation": "Source URL or publication"}, ...]}""",
     "research-system-prompt": """You will be working on researching information for a task. You are a consultant who uses web search to find current, accurate information from reliable sources. The user will provide an executive summary of the task at hand. Output each search result with a clear topic name, detailed description with specific facts, and proper source citation.""",
     "meeting-sub-report-prompt": """You are creating a summary report for a meeting. The meeting was about:
 
@@ -144,9 +224,8 @@ And here are the summaries from the meetings:
 def load_prompts() -> dict:
     prompts_path = get_prompts_path()
     if prompts_path.exists():
-        with open(prompts_path, 'r') as f:
-            data = json.load(f)
-            return {p['id']: p['content'] for p in data.get('prompts', [])}
+        data = load_json_file(prompts_path)
+        return {p['id']: p['content'] for p in data.get('prompts', [])}
     save_prompts(DEFAULT_PROMPTS)
     return DEFAULT_PROMPTS
 
@@ -155,8 +234,7 @@ def save_prompts(prompts: dict):
         "prompts": [{"id": k, "content": v, "name": k.replace("-", " ").title()} for k, v in prompts.items()],
         "version": "1.0"
     }
-    with open(get_prompts_path(), 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json_file(get_prompts_path(), data, indent=True)
 
 def get_prompt(prompt_id: str) -> str:
     prompts = load_prompts()
@@ -166,42 +244,136 @@ def get_prompt(prompt_id: str) -> str:
 # SESSION MANAGEMENT
 # ============================================================
 
-def load_sessions_metadata() -> list:
+# Sessions live in one SQLite database. Chat and meeting messages are stored
+# one row each, so saving a session only inserts the messages it gained
+SESSION_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    created_date TEXT NOT NULL,
+    last_modified_date TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    people BLOB NOT NULL DEFAULT '[]',
+    research_findings BLOB NOT NULL DEFAULT '[]',
+    meetings BLOB NOT NULL DEFAULT '[]',
+    final_report TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS messages (
+    session_id TEXT NOT NULL,
+    meeting_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    message BLOB NOT NULL,
+    PRIMARY KEY (session_id, meeting_id, field, seq)
+);
+"""
+
+# Session fields held in a column of the sessions table, and whether it holds JSON
+SESSION_COLUMNS = {
+    "summary": False,
+    "people": True,
+    "research_findings": True,
+    "meetings": True,
+    "final_report": False
+}
+
+# Message lists outside meetings; meeting messages use field "messages" and the meeting id
+SESSION_MESSAGE_FIELDS = ("messages", "report_chat_messages")
+
+_db_local = threading.local()
+
+def get_db_path() -> Path:
+    return get_data_dir() / "sessions.db"
+
+def get_db() -> sqlite3.Connection:
+    # One connection per thread; transactions are opened explicitly. The
+    # connection is only kept once the schema is in place, so a failed setup
+    # is retried on the next call instead of leaving a half-initialised handle
+    db = getattr(_db_local, 'db', None)
+    if db is None:
+        db = sqlite3.connect(get_db_path(), timeout=30, isolation_level=None)
+        try:
+            init_db(db)
+        except BaseException:
+            db.close()
+            raise
+        _db_local.db = db
+    return db
+
+@contextmanager
+def transaction(db: sqlite3.Connection = None):
+    # BEGIN IMMEDIATE takes the write lock up front, so concurrent writers queue
+    # instead of failing when they try to upgrade a read transaction
+    db = db or get_db()
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        yield db
+        db.execute("COMMIT")
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+
+# Stored in PRAGMA user_version once the old JSON session files have been imported
+SCHEMA_VERSION = 1
+
+def init_db(db: sqlite3.Connection):
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SESSION_SCHEMA)
+    if db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        migrate_session_files(db)
+
+def migrate_session_files(db: sqlite3.Connection):
+    # One-time import of the JSON files sessions were stored in before. The files
+    # are left untouched: the Streamlit app keeps using metadata.json
     metadata_path = get_sessions_dir() / "metadata.json"
-    if metadata_path.exists():
-        with open(metadata_path, 'r') as f:
-            return json.load(f)
-    return []
+    with transaction(db):
+        if db.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        if not metadata_path.exists():
+            return
+        for meta in loads_json(metadata_path.read_bytes()):
+            db.execute(
+                "INSERT OR IGNORE INTO sessions (id, name, created_date, last_modified_date) VALUES (?, ?, ?, ?)",
+                (meta['id'], meta['name'], meta['created_date'], meta['last_modified_date'])
+            )
+            session_file = get_sessions_dir() / f"{meta['id']}.json"
+            if session_file.exists():
+                write_session_fields(db, meta['id'], loads_json(session_file.read_bytes()), touch=False)
+
+def load_sessions_metadata() -> list:
+    rows = get_db().execute(
+        "SELECT id, name, created_date, last_modified_date FROM sessions ORDER BY rowid"
+    ).fetchall()
+    return [
+        {"id": row[0], "name": row[1], "created_date": row[2], "last_modified_date": row[3]}
+        for row in rows
+    ]
 
-def save_sessions_metadata(sessions: list):
-    with open(get_sessions_dir() / "metadata.json", 'w') as f:
-        json.dump(sessions, f, indent=2)
+def count_sessions() -> int:
+    return get_db().execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
 
 def create_session(name: str) -> dict:
     session_data = {
-        "id": str(uuid.uuid4()),
+        "id": uuid.uuid4().hex,
         "name": name,
         "created_date": datetime.now().isoformat(),
         "last_modified_date": datetime.now().isoformat()
     }
-    sessions = load_sessions_metadata()
-    sessions.append(session_data)
-    save_sessions_metadata(sessions)
+    with transaction() as db:
+        db.execute(
+            "INSERT INTO sessions (id, name, created_date, last_modified_date) VALUES (?, ?, ?, ?)",
+            (session_data['id'], name, session_data['created_date'], session_data['last_modified_date'])
+        )
     return session_data
 
 def delete_session(session_id: str):
-    sessions = load_sessions_metadata()
-    sessions = [s for s in sessions if s['id'] != session_id]
-    save_sessions_metadata(sessions)
-    session_file = get_sessions_dir() / f"{session_id}.json"
-    if session_file.exists():
-        session_file.unlink()
+    with transaction() as db:
+        db.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+        db.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
 
-def load_session_data(session_id: str) -> dict:
-    session_file = get_sessions_dir() / f"{session_id}.json"
-    if session_file.exists():
-        with open(session_file, 'r') as f:
-            return json.load(f)
+def new_session_data() -> dict:
     return {
         "messages": [],
         "summary": "",
@@ -212,42 +384,408 @@ def load_session_data(session_id: str) -> dict:
         "report_chat_messages": []
     }
 
-def save_session_data(session_id: str, data: dict):
-    with open(get_sessions_dir() / f"{session_id}.json", 'w') as f:
-        json.dump(data, f, indent=2)
+def session_field_error(field: str, value):
+    # Returns why value cannot be stored in the session field, or None if it can
+    if isinstance(new_session_data()[field], list):
+        if not isinstance(value, list):
+            return f"{field} must be a list"
+        if field in SESSION_MESSAGE_FIELDS or field == "meetings":
+            if not all(isinstance(item, dict) for item in value):
+                return f"{field} must be a list of objects"
+        if field == "meetings" and not all(isinstance(meeting.get('id'), str) for meeting in value):
+            return "Every meeting needs an id"
+        if field == "meetings" and not all(isinstance(meeting.get('messages', []), list) for meeting in value):
+            return "Meeting messages must be a list"
+    elif not isinstance(value, str):
+        return f"{field} must be a string"
+    return None
+
+def load_session_data(session_id: str) -> dict:
+    db = get_db()
+    row = db.execute(
+        "SELECT summary, people, research_findings, meetings, final_report FROM sessions WHERE id = ?",
+        (session_id,)
+    ).fetchone()
+    data = new_session_data()
+    if row is None:
+        return data
+    for (field, is_json), value in zip(SESSION_COLUMNS.items(), row):
+        data[field] = loads_json(value) if is_json else value
+
+    meetings = {meeting['id']: meeting for meeting in data['meetings']}
+    for meeting in meetings.values():
+        meeting['messages'] = []
+    rows = db.execute(
+        "SELECT meeting_id, field, message FROM messages WHERE session_id = ? ORDER BY meeting_id, field, seq",
+        (session_id,)
+    )
+    for meeting_id, field, message in rows:
+        if meeting_id:
+            if meeting_id in meetings:
+                meetings[meeting_id]['messages'].append(loads_json(message))
+        else:
+            data[field].append(loads_json(message))
+    return data
+
+def save_session_data(session_id: str, data: dict) -> bool:
+    with transaction() as db:
+        return write_session_fields(db, session_id, data)
+
+def write_session_fields(db: sqlite3.Connection, session_id: str, fields: dict, touch: bool = True) -> bool:
+    # Writes the given top-level fields; returns False if the session does not exist
+    if db.execute("SELECT 1 FROM sessions WHERE id = ?", (session_id,)).fetchone() is None:
+        return False
+
+    columns = {}
+    for field, value in fields.items():
+        if field in SESSION_MESSAGE_FIELDS:
+            sync_messages(db, session_id, "", field, value)
+        elif field == "meetings":
+            for meeting in value:
+                sync_messages(db, session_id, meeting['id'], "messages", meeting.get('messages', []))
+            meeting_ids = [meeting['id'] for meeting in value]
+            db.execute(
+                f"DELETE FROM messages WHERE session_id = ? AND meeting_id != '' "
+                f"AND meeting_id NOT IN ({', '.join('?' * len(meeting_ids))})",
+                (session_id, *meeting_ids)
+            )
+            columns[field] = dumps_json([
+                {key: item for key, item in meeting.items() if key != 'messages'} for meeting in value
+            ])
+        elif field in SESSION_COLUMNS:
+            columns[field] = dumps_json(value) if SESSION_COLUMNS[field] else value
+
+    if touch:
+        columns["last_modified_date"] = datetime.now().isoformat()
+    if columns:
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        db.execute(f"UPDATE sessions SET {assignments} WHERE id = ?", (*columns.values(), session_id))
+    return True
+
+def sync_messages(db: sqlite3.Connection, session_id: str, meeting_id: str, field: str, messages: list):
+    # Message lists mostly just grow, so when every stored message is unchanged
+    # only the new tail is inserted; any edit, removal or reorder rewrites the list
+    payloads = [dumps_json(message) for message in messages]
+    stored = [bytes(row[0]) for row in db.execute(
+        "SELECT message FROM messages WHERE session_id = ? AND meeting_id = ? AND field = ? ORDER BY seq",
+        (session_id, meeting_id, field)
+    )]
+    start = len(stored)
+    if stored != payloads[:start]:
+        db.execute(
+            "DELETE FROM messages WHERE session_id = ? AND meeting_id = ? AND field = ?",
+            (session_id, meeting_id, field)
+        )
+        start = 0
+    db.executemany(
+        "INSERT INTO messages (session_id, meeting_id, field, seq, message) VALUES (?, ?, ?, ?, ?)",
+        [(session_id, meeting_id, field, seq, payloads[seq]) for seq in range(start, len(payloads))]
+    )
+
+def add_session_message(session_id: str, meeting_id: str, field: str, message: dict) -> bool:
+    # Inserts one message row; returns False if the session or meeting does not exist
+    with transaction() as db:
+        row = db.execute("SELECT meetings FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        if row is None:
+            return False
+        if meeting_id and all(meeting.get('id') != meeting_id for meeting in loads_json(row[0])):
+            return False
+        db.execute(
+            "INSERT INTO messages (session_id, meeting_id, field, seq, message) "
+            "SELECT ?, ?, ?, COALESCE(MAX(seq) + 1, 0), ? FROM messages "
+            "WHERE session_id = ? AND meeting_id = ? AND field = ?",
+            (session_id, meeting_id, field, dumps_json(message), session_id, meeting_id, field)
+        )
+        return write_session_fields(db, session_id, {})
 
 # ============================================================
 # OPENAI API SERVICE
 # ============================================================
 
+# Replies to identical requests, kept on disk for ttl seconds
+# How often set() sweeps the cache directory for expired entries
+LLM_CACHE_PRUNE_INTERVAL = 3600
+
+class LLMCache:
+    def __init__(self, cache_dir: Path, ttl: float = 7 * 24 * 3600):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.last_prune = 0.0
+
+    def key(self, model: str, system_prompt: str, messages: list) -> str:
+        request_json = json.dumps({"model": model, "sys": system_prompt, "msgs": messages}, sort_keys=True)
+        return hashlib.sha256(request_json.encode()).hexdigest()
+
+    def get(self, key: str):
+        path = self.cache_dir / f"{key}.json"
+        if not path.exists():
+            return None
+        stored = loads_json(path.read_bytes())
+        if time.time() - stored["ts"] >= self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+        return stored["content"]
+
+    def set(self, key: str, content: str):
+        write_json_file(self.cache_dir / f"{key}.json", {"ts": time.time(), "content": content})
+        now = time.time()
+        if now - self.last_prune >= LLM_CACHE_PRUNE_INTERVAL:
+            self.last_prune = now
+            self.prune(now)
+
+    def prune(self, now: float):
+        # Entries are written once, so the file mtime is their timestamp
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                if now - path.stat().st_mtime >= self.ttl:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+# Upper bound on requests in flight at once, to stay within OpenAI rate limits
+MAX_CONCURRENT_REQUESTS = 10
+
+# HTTP/2 lets concurrent calls share one connection; the pool covers HTTP/1.1 fallback.
+# Non-streamed replies arrive in one piece, so the read timeout must cover a full reply
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+OPENAI_HTTP_TIMEOUT = httpx.Timeout(120.0, connect=5.0)
+
 class OpenAIService:
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.client = OpenAI(api_key=api_key) if api_key else None
+        self.client = OpenAI(
+            api_key=api_key,
+            http_client=httpx.Client(http2=True, limits=OPENAI_HTTP_LIMITS, timeout=OPENAI_HTTP_TIMEOUT)
+        ) if api_key else None
         self.model = "gpt-4o"
-
-    def send_message(self, messages: list, system_prompt: str = None) -> str:
+        self.cache = LLMCache(get_response_cache_dir())
+
+    def build_request(self, messages: list, system_prompt: str = None, cache_key: str = None,
+                      json_mode: bool = False) -> dict:
+        api_messages = []
+        if system_prompt:
+            api_messages.append({"role": "system", "content": system_prompt})
+        api_messages.extend([{"role": m["role"], "content": m["content"]} for m in messages])
+
+        # prompt_cache_key routes calls that share a prefix to the same provider cache
+        api_request = {
+            "model": self.model,
+            "max_tokens": 4096,
+            "messages": api_messages,
+            "extra_body": {"prompt_cache_key": cache_key} if cache_key else None
+        }
+        if json_mode:
+            api_request["response_format"] = {"type": "json_object"}
+        return api_request
+
+    def send_message(self, messages: list, system_prompt: str = None, use_cache: bool = False,
+                     cache_key: str = None, json_mode: bool = False, accept=None,
+                     refresh_cache: bool = False) -> str:
+        # accept(reply) decides whether a reply is worth caching; a stored reply
+        # it rejects is ignored and replaced, as is any stored reply on refresh_cache
         if not self.client:
             return "Error: API key not configured. Please set your API key in Settings."
-        try:
-            api_messages = []
-            if system_prompt:
-                api_messages.append({"role": "system", "content": system_prompt})
-            api_messages.extend([{"role": m["role"], "content": m["content"]} for m in messages])
 
+        if use_cache:
+            response_key = self.cache.key(self.model, system_prompt, messages)
+            cached = None if refresh_cache else self.cache.get(response_key)
+            if cached is not None and (accept is None or accept(cached)):
+                return cached
+
+        try:
             response = self.client.chat.completions.create(
-                model=self.model,
-                max_tokens=4096,
-                messages=api_messages
+                **self.build_request(messages, system_prompt, cache_key, json_mode)
             )
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
         except Exception as e:
             return f"Error: {str(e)}"
 
+        if use_cache and (accept is None or accept(content)):
+            self.cache.set(response_key, content)
+        return content
+
+    def send_message_stream(self, messages: list, system_prompt: str = None, cache_key: str = None):
+        # Failures propagate so sse_response can report them as an error event
+        # rather than as reply text the client would save
+        if not self.client:
+            raise RuntimeError("API key not configured. Please set your API key in Settings.")
+
+        stream = self.client.chat.completions.create(
+            stream=True, **self.build_request(messages, system_prompt, cache_key)
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def send_batch(self, batch: list, cache_key: str = None) -> list:
+        # Sends independent conversations concurrently; replies keep batch order
+        if not self.client:
+            return ["Error: API key not configured. Please set your API key in Settings."] * len(batch)
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        # The async pool is tied to this request's event loop, so it is not kept
+        http_client = httpx.AsyncClient(http2=True, limits=OPENAI_HTTP_LIMITS, timeout=OPENAI_HTTP_TIMEOUT)
+        async with AsyncOpenAI(api_key=self.api_key, http_client=http_client) as client:
+            async def send(messages):
+                async with semaphore:
+                    try:
+                        response = await client.chat.completions.create(
+                            **self.build_request(messages, cache_key=cache_key)
+                        )
+                        return response.choices[0].message.content
+                    except Exception as e:
+                        return f"Error: {str(e)}"
+
+            return await asyncio.gather(*(send(messages) for messages in batch))
+
+# One service per key, so its HTTP connection pool is reused across requests
+@lru_cache(maxsize=4)
+def _get_service(api_key: str) -> OpenAIService:
+    return OpenAIService(api_key)
+
 def get_api_service() -> OpenAIService:
     config = load_config()
     api_key = config.get('api_key', os.environ.get('OPENAI_API_KEY', ''))
-    return OpenAIService(api_key)
+    return _get_service(api_key)
+
+@lru_cache(maxsize=64)
+def compile_template(template: str) -> tuple:
+    return split_template(template)
+
+def render_prompt(template: str, values: dict) -> str:
+    # Same placeholder rules as the Streamlit app, see prompt_templates
+    return fill_template(compile_template(template), values)
+
+# Each expert's prompt is the same on every turn of a meeting
+@lru_cache(maxsize=256)
+def render_expert_prompt(template: str, person_description: str, meeting_description: str) -> str:
+    return render_prompt(template, {
+        "PERSON_DESCRIPTION": person_description,
+        "SUMMARY": SUMMARY_REFERENCE,
+        "MEETING_DESCRIPTION": meeting_description
+    })
+
+def build_static_first_messages(prompt_id: str, data: dict) -> list:
+    # The template goes first with its placeholders pointing at the data, so it
+    # is byte-identical across calls and the provider can reuse its cached
+    # prefix; the request-specific values follow in a second message
+    instructions = render_prompt(get_prompt(prompt_id), {
+        name: f"(see {name.replace('_', ' ')} below)" for name in data
+    })
+    data_message = "\n\n".join(f"{name.replace('_', ' ')}:\n{value}" for name, value in data.items())
+    return [
+        {"role": "user", "content": instructions},
+        {"role": "user", "content": data_message}
+    ]
+
+def build_meeting_history(person: dict, meeting: dict, summary: str, user_question: str = None) -> list:
+    prompt = render_expert_prompt(
+        get_prompt("meeting-expert-instructions"), person.get('description', ''), meeting.get('description', '')
+    )
+
+    # The summary is shared by every participant, so it leads the prompt
+    history = [
+        {"role": "system", "content": f"Executive summary:\n{summary}"},
+        {"role": "user", "content": prompt},
+        {"role": "assistant", "content": "Understood. I'm ready to participate in the meeting."}
+    ]
+
+    # Add meeting messages
+    for msg in meeting.get('messages', [])[1:]:
+        if msg.get('participant_id') or msg.get('participant_name') == "You":
+            history.append({
+                "role": "user",
+                "content": f"{msg['participant_name']} said: {msg['content']}\n\nPlease respond as the {person['title']}."
+            })
+
+    if len(meeting.get('messages', [])) == 1:
+        history.append({
+            "role": "user",
+            "content": "Please share your initial thoughts on this topic."
+        })
+    elif user_question:
+        history.append({
+            "role": "user",
+            "content": f"The facilitator asks you directly: {user_question}\n\nPlease respond as the {person['title']}."
+        })
+
+    return history
+
+# Appended to the system prompt of JSON-mode requests, which must return an object;
+# it also covers edited prompts that still ask for a bare array
+JSON_OBJECT_INSTRUCTION = '\n\nRespond with a JSON object whose "{key}" field holds the array of results, even if asked for a bare array.'
+
+# Fallback for replies that wrap the array in prose or markdown fences
+JSON_ARRAY_PATTERN = re.compile(r'\[[\s\S]*\]')
+
+def parse_json_array(response: str, key: str) -> list:
+    try:
+        data = loads_json(response)
+    except ValueError:
+        json_match = JSON_ARRAY_PATTERN.search(response)
+        if not json_match:
+            raise ValueError("Failed to parse response")
+        return loads_json(json_match.group())
+    if not isinstance(data, dict):
+        return data
+    # Models sometimes pick their own key for the array, so take the first list
+    if isinstance(data.get(key), list):
+        return data[key]
+    for value in data.values():
+        if isinstance(value, list):
+            return value
+    raise ValueError("Failed to parse response")
+
+def parse_people(response: str) -> list:
+    return [
+        {"id": uuid.uuid4().hex, "title": p["title"], "description": p["description"]}
+        for p in parse_json_array(response, "people")[:5]
+    ]
+
+def parse_findings(response: str) -> list:
+    return [
+        {
+            "id": uuid.uuid4().hex,
+            "topic": f["topic"],
+            "description": f["description"],
+            "citation": f["citation"]
+        }
+        for f in parse_json_array(response, "findings")[:10]
+    ]
+
+def parses_with(parse):
+    # Only replies that parse are kept in the response cache
+    def accept(response: str) -> bool:
+        try:
+            parse(response)
+        except Exception:
+            return False
+        return True
+    return accept
+
+def wants_stream() -> bool:
+    # Opt in with ?stream=1 or an Accept: text/event-stream header
+    return request.args.get('stream') == '1' or 'text/event-stream' in request.headers.get('Accept', '')
+
+def sse_response(chunks) -> Response:
+    # Each chunk is sent JSON-encoded so newlines inside it cannot break the
+    # event framing; a final "done" event marks the end of the reply, and a
+    # failure part-way through ends the stream with an "error" event instead
+    def events():
+        try:
+            for chunk in chunks:
+                yield f"data: {dumps_json(chunk).decode()}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {dumps_json(str(e)).decode()}\n\n"
+            return
+        yield "event: done\ndata: {}\n\n"
+    return Response(stream_with_context(events()), mimetype='text/event-stream')
+
+def refresh_response_cache() -> bool:
+    # Clients send X-No-Cache to force a fresh reply, e.g. when regenerating;
+    # the fresh reply then replaces the stored one
+    return 'X-No-Cache' in request.headers
 
 # ============================================================
 # API ROUTES - Authentication
@@ -300,7 +838,9 @@ def get_sessions():
 @login_required
 def create_new_session():
     data = request.json
-    name = data.get('name', f"Session {len(load_sessions_metadata()) + 1}")
+    name = data.get('name')
+    if name is None:
+        name = f"Session {count_sessions() + 1}"
     new_session = create_session(name)
     return jsonify(new_session)
 
@@ -310,11 +850,53 @@ def get_session(session_id):
     data = load_session_data(session_id)
     return jsonify(data)
 
+# Legacy: resends the whole session; prefer append_message and set_field for small edits
 @app.route('/api/sessions/<session_id>', methods=['PUT'])
 @login_required
 def update_session(session_id):
     data = request.json
-    save_session_data(session_id, data)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Session data must be an object"}), 400
+    for field in new_session_data().keys() & data.keys():
+        error = session_field_error(field, data[field])
+        if error:
+            return jsonify({"error": error}), 400
+
+    if not save_session_data(session_id, data):
+        return jsonify({"error": "Session not found"}), 404
+    return jsonify({"success": True})
+
+@app.route('/api/sessions/<session_id>/append_message', methods=['POST'])
+@login_required
+def append_session_message(session_id):
+    data = request.json
+    message = data.get('message')
+    meeting_id = data.get('meeting_id')
+    field = data.get('field', 'messages')
+    if not isinstance(message, dict):
+        return jsonify({"error": "message is required"}), 400
+    if not meeting_id and field not in ('messages', 'report_chat_messages'):
+        return jsonify({"error": f"Cannot append to {field}"}), 400
+
+    if not add_session_message(session_id, meeting_id or "", 'messages' if meeting_id else field, message):
+        return jsonify({"error": "Session or meeting not found"}), 404
+    return jsonify({"success": True})
+
+@app.route('/api/sessions/<session_id>/set_field', methods=['POST'])
+@login_required
+def set_session_field(session_id):
+    data = request.json
+    field = data.get('field')
+    if field not in new_session_data():
+        return jsonify({"error": f"Unknown field: {field}"}), 400
+    if 'value' not in data:
+        return jsonify({"error": "value is required"}), 400
+    error = session_field_error(field, data['value'])
+    if error:
+        return jsonify({"error": error}), 400
+
+    if not save_session_data(session_id, {field: data['value']}):
+        return jsonify({"error": "Session not found"}), 404
     return jsonify({"success": True})
 
 @app.route('/api/sessions/<session_id>', methods=['DELETE'])
@@ -335,6 +917,8 @@ def ai_chat():
     system_prompt = data.get('system_prompt')
 
     service = get_api_service()
+    if wants_stream():
+        return sse_response(service.send_message_stream(messages, system_prompt))
     response = service.send_message(messages, system_prompt)
     return jsonify({"response": response})
 
@@ -345,10 +929,10 @@ def generate_summary():
     messages = data.get('messages', [])
 
     service = get_api_service()
-    summary_messages = messages.copy()
-    summary_messages.append({"role": "user", "content": get_prompt("discovery-summarize")})
+    # The list was parsed from this request's body, so it can be extended in place
+    messages.append({"role": "user", "content": get_prompt("discovery-summarize")})
 
-    response = service.send_message(summary_messages)
+    response = service.send_message(messages)
     return jsonify({"summary": response})
 
 @app.route('/api/ai/generate-people', methods=['POST'])
@@ -358,28 +942,19 @@ def generate_people():
     summary = data.get('summary', '')
 
     service = get_api_service()
-    user_prompt = get_prompt("people-user-prompt").replace("{EXECUTIVE_SUMMARY}", summary)
-    system_prompt = get_prompt("people-system-prompt")
+    system_prompt = get_prompt("people-system-prompt") + JSON_OBJECT_INSTRUCTION.format(key="people")
 
-    messages = [{"role": "user", "content": user_prompt}]
-    response = service.send_message(messages, system_prompt)
+    messages = build_static_first_messages("people-user-prompt", {"EXECUTIVE_SUMMARY": summary})
+    response = service.send_message(messages, system_prompt, cache_key="people-v1", json_mode=True,
+                                    use_cache=True, refresh_cache=refresh_response_cache(),
+                                    accept=parses_with(parse_people))
 
     # Parse JSON response
-    import re
     try:
-        json_match = re.search(r'\[[\s\S]*\]', response)
-        if json_match:
-            people_data = json.loads(json_match.group())
-            people = [
-                {"id": str(uuid.uuid4()), "title": p["title"], "description": p["description"]}
-                for p in people_data[:5]
-            ]
-            return jsonify({"people": people})
+        return jsonify({"people": parse_people(response)})
     except Exception as e:
         return jsonify({"error": str(e), "raw_response": response}), 500
 
-    return jsonify({"error": "Failed to parse response", "raw_response": response}), 500
-
 @app.route('/api/ai/generate-research', methods=['POST'])
 @login_required
 def generate_research():
@@ -387,33 +962,19 @@ def generate_research():
     summary = data.get('summary', '')
 
     service = get_api_service()
-    user_prompt = get_prompt("research-user-prompt").replace("{EXECUTIVE_SUMMARY}", summary)
-    system_prompt = get_prompt("research-system-prompt")
+    system_prompt = get_prompt("research-system-prompt") + JSON_OBJECT_INSTRUCTION.format(key="findings")
 
-    messages = [{"role": "user", "content": user_prompt}]
-    response = service.send_message(messages, system_prompt)
+    messages = build_static_first_messages("research-user-prompt", {"EXECUTIVE_SUMMARY": summary})
+    response = service.send_message(messages, system_prompt, cache_key="research-v1", json_mode=True,
+                                    use_cache=True, refresh_cache=refresh_response_cache(),
+                                    accept=parses_with(parse_findings))
 
     # Parse JSON response
-    import re
     try:
-        json_match = re.search(r'\[[\s\S]*\]', response)
-        if json_match:
-            findings_data = json.loads(json_match.group())
-            findings = [
-                {
-                    "id": str(uuid.uuid4()),
-                    "topic": f["topic"],
-                    "description": f["description"],
-                    "citation": f["citation"]
-                }
-                for f in findings_data[:10]
-            ]
-            return jsonify({"findings": findings})
+        return jsonify({"findings": parse_findings(response)})
     except Exception as e:
         return jsonify({"error": str(e), "raw_response": response}), 500
 
-    return jsonify({"error": "Failed to parse response", "raw_response": response}), 500
-
 @app.route('/api/ai/meeting-response', methods=['POST'])
 @login_required
 def get_meeting_response():
@@ -425,37 +986,32 @@ def get_meeting_response():
 
     service = get_api_service()
 
-    prompt = get_prompt("meeting-expert-instructions")
-    prompt = prompt.replace("{PERSON_DESCRIPTION}", person.get('description', ''))
-    prompt = prompt.replace("{SUMMARY}", summary)
-    prompt = prompt.replace("{MEETING_DESCRIPTION}", meeting.get('description', ''))
+    history = build_meeting_history(person, meeting, summary, user_question)
 
-    history = [
-        {"role": "user", "content": prompt},
-        {"role": "assistant", "content": "Understood. I'm ready to participate in the meeting."}
-    ]
+    if wants_stream():
+        return sse_response(service.send_message_stream(history, cache_key="meeting-response-v1"))
+    response = service.send_message(history, cache_key="meeting-response-v1")
+    return jsonify({"response": response})
 
-    # Add meeting messages
-    for msg in meeting.get('messages', [])[1:]:
-        if msg.get('participant_id') or msg.get('participant_name') == "You":
-            history.append({
-                "role": "user",
-                "content": f"{msg['participant_name']} said: {msg['content']}\n\nPlease respond as the {person['title']}."
-            })
+@app.route('/api/ai/meeting-round', methods=['POST'])
+@login_required
+async def get_meeting_round():
+    data = request.json
+    people = data.get('people', [])
+    meeting = data.get('meeting', {})
+    summary = data.get('summary', '')
+    user_question = data.get('user_question')
 
-    if len(meeting.get('messages', [])) == 1:
-        history.append({
-            "role": "user",
-            "content": "Please share your initial thoughts on this topic."
-        })
-    elif user_question:
-        history.append({
-            "role": "user",
-            "content": f"The facilitator asks you directly: {user_question}\n\nPlease respond as the {person['title']}."
-        })
+    service = get_api_service()
 
-    response = service.send_message(history)
-    return jsonify({"response": response})
+    # Every expert answers the same transcript, so the calls are independent
+    batch = [build_meeting_history(person, meeting, summary, user_question) for person in people]
+    responses = await service.send_batch(batch, cache_key="meeting-response-v1")
+
+    return jsonify({"responses": [
+        {"person_id": person.get('id'), "response": response}
+        for person, response in zip(people, responses)
+    ]})
 
 @app.route('/api/ai/meeting-summary', methods=['POST'])
 @login_required
@@ -465,18 +1021,19 @@ def generate_meeting_summary():
 
     service = get_api_service()
 
-    transcript = ""
-    for msg in meeting.get('messages', [])[1:]:
-        if msg.get('participant_id') or msg.get('participant_name') == "You":
-            transcript += f"\n\n[{msg['participant_name']}]:\n{msg['content']}"
-
-    prompt = get_prompt("meeting-sub-report-prompt")
-    prompt = prompt.replace("{MEETING_TOPIC}", meeting.get('topic', ''))
-    prompt = prompt.replace("{MEETING_DESCRIPTION}", meeting.get('description', ''))
-    prompt = prompt.replace("{TRANSCRIPT}", transcript)
+    transcript = "".join(
+        f"\n\n[{msg['participant_name']}]:\n{msg['content']}"
+        for msg in meeting.get('messages', [])[1:]
+        if msg.get('participant_id') or msg.get('participant_name') == "You"
+    )
 
-    messages = [{"role": "user", "content": prompt}]
-    response = service.send_message(messages)
+    messages = build_static_first_messages("meeting-sub-report-prompt", {
+        "MEETING_TOPIC": meeting.get('topic', ''),
+        "MEETING_DESCRIPTION": meeting.get('description', ''),
+        "TRANSCRIPT": transcript
+    })
+    response = service.send_message(messages, cache_key="meeting-summary-v1",
+                                    use_cache=True, refresh_cache=refresh_response_cache())
 
     return jsonify({"summary": response})
 
@@ -497,12 +1054,14 @@ def generate_final_report():
     combined_summaries = "\n\n---\n\n".join(summaries)
 
     system_prompt = get_prompt("report-system-prompt")
-    user_prompt = get_prompt("report-user-prompt")
-    user_prompt = user_prompt.replace("{DISCOVERY_SUMMARY}", summary)
-    user_prompt = user_prompt.replace("{COMBINED_SUB_REPORTS}", combined_summaries)
-
-    messages = [{"role": "user", "content": user_prompt}]
-    response = service.send_message(messages, system_prompt)
+    messages = build_static_first_messages("report-user-prompt", {
+        "DISCOVERY_SUMMARY": summary,
+        "COMBINED_SUB_REPORTS": combined_summaries
+    })
+    if wants_stream():
+        return sse_response(service.send_message_stream(messages, system_prompt, cache_key="report-v1"))
+    response = service.send_message(messages, system_prompt, cache_key="report-v1",
+                                    use_cache=True, refresh_cache=refresh_response_cache())
 
     return jsonify({"report": response})
 
@@ -522,9 +1081,10 @@ def get_api_key_status():
 def set_api_key():
     data = request.json
     api_key = data.get('api_key', '')
-    config = load_config()
-    config['api_key'] = api_key
+    config = {**load_config(), 'api_key': api_key}
     save_config(config)
+    # Drop clients built for the previous key
+    _get_service.cache_clear()
     return jsonify({"success": True})
 
 @app.route('/api/prompts', methods=['GET'])
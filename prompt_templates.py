@@ -0,0 +1,22 @@
+# Prompt template rules shared by the Flask backend and the Streamlit app, so an
+# edited prompts.json renders the same way in both
+import re
+
+# {PLACEHOLDER} names are upper-case letters and underscores; other braces, such
+# as JSON examples inside a prompt, are left as written
+PLACEHOLDER_PATTERN = re.compile(r'\{([A-Z_]+)\}')
+
+# Stands in for the executive summary inside prompts that are sent after it
+SUMMARY_REFERENCE = "(see the executive summary above)"
+
+def split_template(template: str) -> tuple:
+    # Alternating literal text and placeholder names, starting with literal text
+    return tuple(PLACEHOLDER_PATTERN.split(template))
+
+def fill_template(segments: tuple, values: dict) -> str:
+    # One pass over the segments: inserted values are not rescanned, and
+    # placeholders without a value are kept as written
+    return "".join(
+        segment if i % 2 == 0 else values.get(segment, f"{{{segment}}}")
+        for i, segment in enumerate(segments)
+    )
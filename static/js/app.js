@@ -28,11 +28,12 @@ const state = {
 // API HELPER FUNCTIONS
 // ============================================================
 
-async function apiCall(endpoint, method = 'GET', data = null) {
+async function apiCall(endpoint, method = 'GET', data = null, headers = {}) {
     const options = {
         method,
         headers: {
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            ...headers
         },
         credentials: 'include'
     };
@@ -51,6 +52,74 @@ async function apiCall(endpoint, method = 'GET', data = null) {
     return response.json();
 }
 
+// Regenerating asks the server for a fresh reply instead of its stored one
+function noCacheHeaders(regenerate) {
+    return regenerate ? { 'X-No-Cache': '1' } : {};
+}
+
+// POST to a streaming endpoint and call onText with the reply received so far;
+// rejects if the server reports an error or the stream ends before "done"
+async function apiStream(endpoint, data, onText) {
+    const response = await fetch(`${endpoint}?stream=1`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'Accept': 'text/event-stream'
+        },
+        credentials: 'include',
+        body: JSON.stringify(data)
+    });
+
+    if (response.status === 401) {
+        showLoginPage();
+        throw new Error('Unauthorized');
+    }
+
+    if (!response.ok) {
+        throw new Error(`Stream request failed with status ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let text = '';
+    let finished = false;
+
+    while (!finished) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split('\n\n');
+        buffer = events.pop();
+
+        for (const event of events) {
+            let type = 'message';
+            let payload = '';
+            for (const line of event.split('\n')) {
+                if (line.startsWith('event: ')) type = line.slice(7);
+                else if (line.startsWith('data: ')) payload += line.slice(6);
+            }
+
+            if (type === 'error') {
+                throw new Error(JSON.parse(payload));
+            }
+            if (type === 'done') {
+                finished = true;
+                break;
+            }
+            text += JSON.parse(payload);
+            onText(text);
+        }
+    }
+
+    if (!finished) {
+        throw new Error('Stream ended before the reply was complete');
+    }
+
+    return text;
+}
+
 function showLoading(text = 'Loading...') {
     document.getElementById('loading-text').textContent = text;
     document.getElementById('loading-overlay').classList.remove('hidden');
@@ -239,6 +308,35 @@ async function saveSessionData() {
     }
 }
 
+// Save one message without resending the whole session
+async function appendSessionMessage(message, { meetingId = null, field = 'messages' } = {}) {
+    if (!state.currentSessionId) return;
+
+    try {
+        await apiCall(`/api/sessions/${state.currentSessionId}/append_message`, 'POST', {
+            message: message,
+            meeting_id: meetingId,
+            field: field
+        });
+    } catch (error) {
+        console.error('Failed to save message:', error);
+    }
+}
+
+// Save one top-level session field without resending the whole session
+async function saveSessionField(field) {
+    if (!state.currentSessionId) return;
+
+    try {
+        await apiCall(`/api/sessions/${state.currentSessionId}/set_field`, 'POST', {
+            field: field,
+            value: state.sessionData[field]
+        });
+    } catch (error) {
+        console.error('Failed to save session:', error);
+    }
+}
+
 // ============================================================
 // NAVIGATION
 // ============================================================
@@ -279,7 +377,8 @@ async function sendDiscoveryMessage() {
     if (!message) return;
 
     // Add user message
-    state.sessionData.messages.push({ role: 'user', content: message });
+    const userMessage = { role: 'user', content: message };
+    state.sessionData.messages.push(userMessage);
     renderDiscoveryMessages();
     input.value = '';
 
@@ -294,9 +393,11 @@ async function sendDiscoveryMessage() {
             system_prompt: systemPrompt
         });
 
-        state.sessionData.messages.push({ role: 'assistant', content: result.response });
+        const assistantMessage = { role: 'assistant', content: result.response };
+        state.sessionData.messages.push(assistantMessage);
         renderDiscoveryMessages();
-        await saveSessionData();
+        await appendSessionMessage(userMessage);
+        await appendSessionMessage(assistantMessage);
     } catch (error) {
         console.error('Chat error:', error);
         state.sessionData.messages.push({
@@ -323,7 +424,7 @@ async function generateSummary() {
 
         state.sessionData.summary = result.summary;
         renderTaskSummary();
-        await saveSessionData();
+        await saveSessionField('summary');
         switchStage('task');
     } catch (error) {
         console.error('Summary error:', error);
@@ -371,7 +472,7 @@ function toggleSummaryEdit(showEdit) {
 async function saveSummaryEdit() {
     const textarea = document.getElementById('task-summary-textarea');
     state.sessionData.summary = textarea.value;
-    await saveSessionData();
+    await saveSessionField('summary');
     renderTaskSummary();
     toggleSummaryEdit(false);
 }
@@ -441,7 +542,7 @@ async function savePersonEdit(index) {
     state.sessionData.people[index].title = title;
     state.sessionData.people[index].description = description;
 
-    await saveSessionData();
+    await saveSessionField('people');
     renderPeople();
 }
 
@@ -455,12 +556,12 @@ async function generatePeople() {
         showLoading('Identifying team members...');
         const result = await apiCall('/api/ai/generate-people', 'POST', {
             summary: state.sessionData.summary
-        });
+        }, noCacheHeaders(state.sessionData.people.length > 0));
 
         if (result.people) {
             state.sessionData.people = result.people;
             renderPeople();
-            await saveSessionData();
+            await saveSessionField('people');
         } else {
             alert('Failed to generate team members: ' + (result.error || 'Unknown error'));
         }
@@ -500,7 +601,7 @@ async function generateResearch() {
         showLoading('Researching findings...');
         const result = await apiCall('/api/ai/generate-research', 'POST', {
             summary: state.sessionData.summary
-        });
+        }, noCacheHeaders(state.sessionData.research_findings.length > 0));
 
         if (result.findings) {
             state.sessionData.research_findings = result.findings;
@@ -614,16 +715,17 @@ async function getNextMeetingResponse(userQuestion = null, specificExpertIndex =
             user_question: userQuestion
         });
 
-        meeting.messages.push({
+        const expertMessage = {
             id: crypto.randomUUID(),
             participant_id: person.id,
             participant_name: person.title,
             content: result.response,
             timestamp: new Date().toISOString()
-        });
+        };
+        meeting.messages.push(expertMessage);
 
         renderCurrentMeeting();
-        await saveSessionData();
+        await appendSessionMessage(expertMessage, { meetingId: meeting.id });
     } catch (error) {
         console.error('Meeting response error:', error);
         alert('Failed to get meeting response');
@@ -641,14 +743,16 @@ async function askExpertQuestion() {
     if (!meeting) return;
 
     // Add user question to meeting
-    meeting.messages.push({
+    const questionMessage = {
         id: crypto.randomUUID(),
         participant_name: 'You',
         content: question,
         timestamp: new Date().toISOString()
-    });
+    };
+    meeting.messages.push(questionMessage);
     renderCurrentMeeting();
     input.value = '';
+    await appendSessionMessage(questionMessage, { meetingId: meeting.id });
 
     // Get selected expert
     const expertSelect = document.getElementById('expert-select');
@@ -657,10 +761,43 @@ async function askExpertQuestion() {
     await getNextMeetingResponse(question, specificExpertIndex);
 }
 
-async function autoRunMeeting(count = 5) {
-    for (let i = 0; i < count; i++) {
-        await getNextMeetingResponse();
-        await new Promise(resolve => setTimeout(resolve, 500));
+// Every expert answers the current transcript at once; replies are added in team order
+async function runMeetingRound() {
+    const meeting = state.sessionData.meetings[state.currentMeetingIndex];
+    if (!meeting) return;
+
+    if (state.sessionData.people.length === 0) {
+        alert('Please generate team members first.');
+        return;
+    }
+
+    try {
+        showLoading('The experts are thinking...');
+
+        const result = await apiCall('/api/ai/meeting-round', 'POST', {
+            people: state.sessionData.people,
+            meeting: meeting,
+            summary: state.sessionData.summary
+        });
+
+        const expertMessages = result.responses.map(({ person_id, response }) => ({
+            id: crypto.randomUUID(),
+            participant_id: person_id,
+            participant_name: state.sessionData.people.find(p => p.id === person_id).title,
+            content: response,
+            timestamp: new Date().toISOString()
+        }));
+        meeting.messages.push(...expertMessages);
+
+        renderCurrentMeeting();
+        for (const message of expertMessages) {
+            await appendSessionMessage(message, { meetingId: meeting.id });
+        }
+    } catch (error) {
+        console.error('Meeting round error:', error);
+        alert('Failed to get meeting responses');
+    } finally {
+        hideLoading();
     }
 }
 
@@ -678,7 +815,7 @@ async function endAndSummarizeMeeting() {
 
         const result = await apiCall('/api/ai/meeting-summary', 'POST', {
             meeting: meeting
-        });
+        }, noCacheHeaders(Boolean(meeting.summary_report)));
 
         meeting.summary_report = result.summary;
 
@@ -747,19 +884,27 @@ async function generateFinalReport() {
         return;
     }
 
+    const previousReport = state.sessionData.final_report;
+
     try {
         showLoading('Generating final report...');
 
-        const result = await apiCall('/api/ai/generate-report', 'POST', {
+        const report = await apiStream('/api/ai/generate-report', {
             summary: state.sessionData.summary,
             meetings: state.sessionData.meetings
+        }, partialReport => {
+            hideLoading();
+            state.sessionData.final_report = partialReport;
+            renderReport();
         });
 
-        state.sessionData.final_report = result.report;
+        state.sessionData.final_report = report;
         renderReport();
-        await saveSessionData();
+        await saveSessionField('final_report');
     } catch (error) {
         console.error('Report error:', error);
+        state.sessionData.final_report = previousReport;
+        renderReport();
         alert('Failed to generate final report');
     } finally {
         hideLoading();
@@ -776,7 +921,8 @@ async function sendReportChat() {
         return;
     }
 
-    state.sessionData.report_chat_messages.push({ role: 'user', content: message });
+    const userMessage = { role: 'user', content: message };
+    state.sessionData.report_chat_messages.push(userMessage);
     renderReport();
     input.value = '';
 
@@ -794,9 +940,11 @@ async function sendReportChat() {
             system_prompt: 'You are a helpful assistant that answers questions about the provided report. Be concise and accurate.'
         });
 
-        state.sessionData.report_chat_messages.push({ role: 'assistant', content: result.response });
+        const assistantMessage = { role: 'assistant', content: result.response };
+        state.sessionData.report_chat_messages.push(assistantMessage);
         renderReport();
-        await saveSessionData();
+        await appendSessionMessage(userMessage, { field: 'report_chat_messages' });
+        await appendSessionMessage(assistantMessage, { field: 'report_chat_messages' });
     } catch (error) {
         console.error('Report chat error:', error);
         state.sessionData.report_chat_messages.push({
@@ -1057,7 +1205,7 @@ document.addEventListener('DOMContentLoaded', () => {
             getNextMeetingResponse(null, specificExpertIndex);
         }
     });
-    document.getElementById('meeting-auto-btn').addEventListener('click', () => autoRunMeeting(5));
+    document.getElementById('meeting-auto-btn').addEventListener('click', runMeetingRound);
     document.getElementById('meeting-end-btn').addEventListener('click', endAndSummarizeMeeting);
     document.getElementById('meeting-reset-btn').addEventListener('click', resetCurrentMeeting);
     document.getElementById('meeting-user-input').addEventListener('keydown', (e) => {
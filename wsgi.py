@@ -0,0 +1,2 @@
+# Production entry point: gunicorn wsgi:app
+from backend import app